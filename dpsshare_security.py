@@ -17,8 +17,14 @@ import hmac
 import json
 import random
 import time
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple
 
+import numpy as np
+
+# The key is tiled to this size once per call and the payload is XORed a tile at a time
+XOR_TILE_BYTES = 64 * 1024
+
 
 class ProofOfWork:
     """Implements Proof-of-Work challenge for Sybil attack prevention"""
@@ -239,6 +245,37 @@ class FogNodeSecurity:
         return DigitalSignature.verify(model_data, signature, fog_key)
 
 
+@lru_cache(maxsize=128)
+def _derive_key(pk: str, policy_canon: bytes) -> bytes:
+    """SHA-256 key for a public key and canonical policy bytes, cached across calls"""
+    return hashlib.sha256(pk.encode() + b"_" + policy_canon).digest()
+
+
+class PolicyCipher:
+    """Policy-keyed XOR cipher shared by the Trusted Authority and the facilities"""
+    
+    @staticmethod
+    def canon(attributes: Dict[str, Any]) -> bytes:
+        """Canonical bytes for a flat policy or attribute dict: sorted key=value pairs joined by '|'"""
+        return b"|".join(f"{key}={attributes[key]}".encode() for key in sorted(attributes))
+    
+    @staticmethod
+    def derive_key(pk: str, policy: Dict[str, Any]) -> bytes:
+        """Derive the symmetric key for a public key and access policy"""
+        return _derive_key(pk, PolicyCipher.canon(policy))
+    
+    @staticmethod
+    def xor_with_key(data: bytes, key: bytes) -> bytes:
+        """XOR data with the repeating key, one cache-friendly tile at a time"""
+        data_bytes = np.frombuffer(data, dtype=np.uint8)
+        key_tile = np.tile(np.frombuffer(key, dtype=np.uint8), XOR_TILE_BYTES // len(key))
+        out = np.empty_like(data_bytes)
+        for start in range(0, data_bytes.size, key_tile.size):
+            end = min(start + key_tile.size, data_bytes.size)
+            np.bitwise_xor(data_bytes[start:end], key_tile[:end - start], out=out[start:end])
+        return out.tobytes()
+
+
 def demonstrate_security_features():
     """Demonstrate all security features"""
     print("=" * 70)
@@ -1,7 +1,6 @@
 import pickle
 import sys
 import threading
-import json
 
 import numpy as np
 import requests
@@ -13,7 +12,7 @@ import flcommon
 import mnistcommon
 import time_logger
 from config import ClientConfig
-from dpsshare_security import ProofOfWork, DigitalSignature
+from dpsshare_security import ProofOfWork, DigitalSignature, PolicyCipher
 
 np.random.seed(42)
 tf.random.set_seed(42)
@@ -96,16 +95,11 @@ def request_encrypted_model_from_leader() -> bytes:
         response = requests.get(f"{leader_url}/get_encrypted_model", timeout=10)
         
         if response.status_code == 200:
-            result = response.json()
-            if result.get('success'):
-                encrypted_model = pickle.loads(bytes.fromhex(result['ciphertext']))
-                print(f"[MODEL REQUEST] ✓ Encrypted model received from Leader Server")
-                return encrypted_model
-            else:
-                print(f"[MODEL REQUEST] ✗ Failed to get model: {result.get('error')}")
-                return None
+            encrypted_model = pickle.loads(response.content)
+            print(f"[MODEL REQUEST] ✓ Encrypted model received from Leader Server")
+            return encrypted_model
         else:
-            print(f"[MODEL REQUEST] ✗ Failed: HTTP {response.status_code}")
+            print(f"[MODEL REQUEST] ✗ Failed to get model: HTTP {response.status_code} {response.text}")
             return None
             
     except Exception as e:
@@ -137,15 +131,11 @@ def decrypt_model_with_cpabe(encrypted_model, sk: str, attributes: dict):
         
         print(f"[CP-ABE DECRYPTION] ✓ Access policy satisfied")
         
-        import hashlib
         pk = encrypted_model['pk']
-        encryption_key = hashlib.sha256(f"{pk}_{json.dumps(policy, sort_keys=True)}".encode()).digest()
-        
-        decrypted_data = bytearray()
-        for i, byte in enumerate(encrypted_model['ct']):
-            decrypted_data.append(byte ^ encryption_key[i % len(encryption_key)])
+        encryption_key = PolicyCipher.derive_key(pk, policy)
+        decrypted_data = PolicyCipher.xor_with_key(encrypted_model['ct'], encryption_key)
         
-        model_weights = pickle.loads(bytes(decrypted_data))
+        model_weights = flcommon.loads_arrays(decrypted_data)
         print(f"[CP-ABE DECRYPTION] ✓ Model successfully decrypted")
         print(f"[CP-ABE DECRYPTION] ✓ Ready for local training")
         
@@ -283,7 +273,7 @@ def start_next_round(data):
     signature_list = []
     
     for server in range(config.num_servers):
-        share_data = pickle.dumps(all_servers[server])
+        share_data = pickle.dumps(all_servers[server], protocol=pickle.HIGHEST_PROTOCOL)
         
         signature = DigitalSignature.sign(share_data, signing_key)
         signature_list.append(signature)
@@ -295,7 +285,7 @@ def start_next_round(data):
             'nonce': nonce
         }
         
-        pickle_model_list.append(pickle.dumps(signed_package))
+        pickle_model_list.append(pickle.dumps(signed_package, protocol=pickle.HIGHEST_PROTOCOL))
         len_serialized_model = len(pickle_model_list[server])
         total_upload_cost += len_serialized_model
         print(f"[DIGITAL SIGNATURE] Share {server} signed: {signature[:16]}...")
@@ -4,7 +4,7 @@ import time
 
 import numpy as np
 import requests
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 
 import flcommon
 import time_logger
@@ -51,17 +51,13 @@ def fetch_encrypted_model_from_ta():
         response = requests.get(f"{TA_URL}/get_encrypted_model", timeout=10)
         
         if response.status_code == 200:
-            result = response.json()
-            if result.get('success'):
-                encrypted_model_cache = result['ciphertext']
-                print(f"[LEADER SERVER] ✓ Encrypted model received from TA")
-                print(f"[LEADER SERVER] ✓ Model cached for facility distribution")
-                return True
-            else:
-                print(f"[LEADER SERVER] ✗ Failed: {result.get('error')}")
-                return False
+            # Cache the raw ciphertext bytes and hand them to facilities as-is
+            encrypted_model_cache = response.content
+            print(f"[LEADER SERVER] ✓ Encrypted model received from TA")
+            print(f"[LEADER SERVER] ✓ Model cached for facility distribution")
+            return True
         else:
-            print(f"[LEADER SERVER] ✗ HTTP {response.status_code}")
+            print(f"[LEADER SERVER] ✗ Failed: HTTP {response.status_code} {response.text}")
             return False
             
     except Exception as e:
@@ -89,10 +85,7 @@ def get_encrypted_model():
     
     print(f"[LEADER SERVER] Distributing encrypted model to facility")
     
-    return jsonify({
-        'success': True,
-        'ciphertext': encrypted_model_cache
-    })
+    return Response(encrypted_model_cache, mimetype='application/octet-stream')
 
 
 @api.route('/recv', methods=['POST'])
@@ -166,7 +159,7 @@ def recv_thread(servers_secret, data, remote_addr):
 
     servers_secret.clear()
 
-    pickle_model = pickle.dumps(dpsshare_weights)
+    pickle_model = pickle.dumps(dpsshare_weights, protocol=pickle.HIGHEST_PROTOCOL)
     
     print(f"\n[GLOBAL MODEL REDISTRIBUTION]")
     print(f"[BROADCAST] Distributing global model M_global to all {config.number_of_clients} facilities...")
@@ -95,7 +95,7 @@ def recv_thread(clients_secret, data, remote_addr):
     
     print(f"[AGGREGATION] ✓ Regional aggregation completed for {len(model)} layers")
 
-    pickle_model = pickle.dumps(model)
+    pickle_model = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
     
     fog_node_id = f"fog_server_{config.server_index}"
     fog_signature = FogNodeSecurity.sign_partial_model(pickle_model, fog_node_id)
@@ -106,7 +106,7 @@ def recv_thread(clients_secret, data, remote_addr):
         'fog_node_id': fog_node_id
     }
     
-    signed_package_data = pickle.dumps(signed_fog_package)
+    signed_package_data = pickle.dumps(signed_fog_package, protocol=pickle.HIGHEST_PROTOCOL)
     len_dumped_model = len(signed_package_data)
 
     print(f"[FOG SECURITY] Signing partial aggregated model...")
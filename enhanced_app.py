@@ -1,14 +1,34 @@
 #!/usr/bin/env python3
+import copy
+import gzip
 import http.server
-import socketserver
+import importlib
+import io
+import socket
 import subprocess
 import urllib.parse
 import os
 import threading
 import json
 import time
+import zlib
 import re
+import shutil
+import signal
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from html import escape
+
+import requests
+
+try:
+    import watchfiles
+except ImportError:  # Optional: without it the progress event stream polls instead
+    watchfiles = None
+
+import config
 
 PORT = 5000
 
@@ -16,10 +36,141 @@ PORT = 5000
 running_processes = {}
 progress_data = {}
 saved_results = set()  # Track saved results to avoid duplicates
+process_status = {}  # Last known status per algorithm, pushed by watch_process
+
+PROCESS_STOP_TIMEOUT = 2  # Seconds between SIGTERM and SIGKILL
+
+def tracked_processes():
+    """Yield every Popen object recorded in running_processes"""
+    for process_data in running_processes.values():
+        if isinstance(process_data, dict):
+            # FedShare stores a dict of {'process', 'log_file'} entries
+            for proc_info in process_data.values():
+                yield proc_info['process']
+        else:
+            yield process_data
+
+def stop_process_groups(processes, timeout=PROCESS_STOP_TIMEOUT):
+    """SIGTERM each process's group, then SIGKILL groups still alive after the timeout"""
+    pgids = []
+    for proc in processes:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+            pgids.append(proc.pid)
+        except ProcessLookupError:
+            pass
+    deadline = time.monotonic() + timeout
+    for proc in processes:
+        try:
+            proc.wait(timeout=max(0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            pass
+    for pgid in pgids:
+        while time.monotonic() < deadline:
+            try:
+                os.killpg(pgid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.05)
+        else:
+            try:
+                os.killpg(pgid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+def _pid_alive(pid):
+    """True if pid exists and is not a zombie"""
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            return f.read().rpartition(b')')[2].split()[0] != b'Z'
+    except (FileNotFoundError, ProcessLookupError, IndexError):
+        return False
+
+def terminate_matching(needle, timeout=0.5):
+    """SIGTERM processes whose command line contains needle (like pkill -f) and wait for them to exit"""
+    if not os.path.isdir('/proc'):
+        subprocess.run(['pkill', '-f', needle], capture_output=True)
+        return
+    needle = needle.encode()
+    own = os.getpid()
+    signalled = []
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit() or int(entry.name) == own:
+                continue
+            try:
+                with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                    cmdline = f.read().replace(b'\0', b' ')
+                if needle in cmdline:
+                    os.kill(int(entry.name), signal.SIGTERM)
+                    signalled.append(int(entry.name))
+            except (FileNotFoundError, ProcessLookupError, PermissionError):
+                pass
+    deadline = time.monotonic() + timeout
+    while signalled and time.monotonic() < deadline:
+        signalled = [pid for pid in signalled if _pid_alive(pid)]
+        if signalled:
+            time.sleep(0.02)
+
+def watch_process(algorithm, process):
+    """Record the exit of a launched process without polling it from request handlers"""
+    process_status[algorithm] = {'status': 'running', 'pid': process.pid}
+    def _wait():
+        returncode = process.wait()
+        # Ignore processes that were replaced or cleared in the meantime
+        if running_processes.get(algorithm) is process:
+            process_status[algorithm] = {'status': 'completed', 'returncode': returncode}
+    threading.Thread(target=_wait, name=f'watch-{algorithm}', daemon=True).start()
+
+REAP_INTERVAL = 0.5  # Seconds between polls of a multi-process run
+
+def watch_processes(algorithm, process_infos):
+    """Like watch_process for a run made of several processes, reaping each as it exits"""
+    processes = [info['process'] for info in process_infos.values()]
+    process_status[algorithm] = {'status': 'running', 'pids': [p.pid for p in processes]}
+    def _reap():
+        while any(p.poll() is None for p in processes):
+            time.sleep(REAP_INTERVAL)
+        if running_processes.get(algorithm) is process_infos:
+            returncode = next((p.returncode for p in processes if p.returncode), 0)
+            process_status[algorithm] = {'status': 'completed', 'returncode': returncode}
+    threading.Thread(target=_reap, name=f'reap-{algorithm}', daemon=True).start()
 
 # Results storage
 RESULTS_FILE = 'results/training_results.json'
 
+_VALID_ALGOS = ('fedshare', 'fedavg', 'scotch', 'dpsshare')
+
+# Launch scripts for the algorithms not started process-by-process
+_START_SCRIPTS = {
+    'fedavg': './start-fedavg.sh',
+    'scotch': './start-scotch.sh',
+    'dpsshare': './start-dpsshare.sh'
+}
+
+# Shared workers for training initiation and the per-client start fan-out
+# (sized above the 20-client limit so a launch never starves its own fan-out)
+_BACKGROUND_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix='fl-task')
+
+# Every federated learning process reinitialize_all should stop
+_FL_PROCESS_NAMES = (
+    'fedshareclient.py', 'fedshareserver.py', 'fedshareleadserver.py',
+    'fedavgclient.py', 'fedavgserver.py',
+    'scotchclient.py', 'scotchserver.py',
+    'dpsshareclient.py', 'dpsshareserver.py', 'dpsshareleadserver.py',
+    'trusted_authority.py', 'logger_server.py', 'flask_starter.py',
+    'start-fedshare.sh', 'start-fedavg.sh', 'start-scotch.sh', 'start-dpsshare.sh'
+)
+# pkill -f takes a POSIX extended regex; only '.' in these names needs escaping
+_FL_PROCESS_PATTERN = '|'.join(name.replace('.', r'\.') for name in _FL_PROCESS_NAMES)
+
+# Pre-encoded plain-text replies
+_STARTED_MSG = {a: f"{a.upper()} started successfully!".encode() for a in _VALID_ALGOS}
+_MSG_CFG_OK = b"Configuration updated successfully!"
+_MSG_DPS_OK = b"DPSShare configuration updated successfully!"
+_MSG_REINIT_OK = b"All processes killed and system reinitialized successfully!"
+_MSG_CLEARED_OK = b"All results cleared successfully!"
+
 def save_algorithm_result(algorithm, config_data, metrics):
     """Save algorithm results to a JSON file for comparison"""
     try:
@@ -64,28 +215,288 @@ def load_all_results():
         print(f"Error loading results: {e}")
         return []
 
-def parse_logs_for_progress(algorithm):
-    """Parse log files to extract training progress"""
-    # Import and reload config to get current values
-    import importlib
-    import config
-    importlib.reload(config)
+# Values exposed by /current_config and used to locate log directories
+CONFIG_FIELDS = (
+    'number_of_clients', 'num_servers', 'training_rounds', 'batch_size', 'train_dataset_size',
+    'epochs', 'dp_epsilon', 'dp_sensitivity', 'num_shares', 'threshold'
+)
+
+_config_cache = {'cls': None, 'values': None, 'body': b'', 'etag': ''}
+_config_lock = threading.Lock()
+
+def _cfg():
+    """Return config.Config, re-importing config.py only when the file changed"""
+    st = os.stat('config.py')
+    # The inode changes on every atomic rewrite, even within one mtime tick
+    sig = (st.st_mtime_ns, st.st_ino, st.st_size)
+    mod = sys.modules.get('config')
+    if mod is None or getattr(mod, '_loaded_at', None) != sig:
+        with _config_lock:
+            mod = sys.modules.get('config')
+            if mod is None or getattr(mod, '_loaded_at', None) != sig:
+                mod = importlib.reload(mod) if mod else importlib.import_module('config')
+                mod._loaded_at = sig
+    return mod.Config
+
+def _get_config():
+    """Return current config.py values as a dict, rebuilt only after a reload"""
+    cls = _cfg()
+    if _config_cache['cls'] is not cls:
+        with _config_lock:
+            if _config_cache['cls'] is not cls:
+                values = {name: getattr(cls, name) for name in CONFIG_FIELDS}
+                body = json.dumps(values).encode()
+                _config_cache.update(values=values, body=body, etag='"%08x"' % zlib.crc32(body))
+                _config_cache['cls'] = cls
+    return _config_cache['values']
+
+# Fields each config POST body must carry
+_CONFIG_FIELD_ORDER = ('clients', 'rounds', 'batch_size', 'train_dataset_size', 'epochs')
+_REQUIRED_CONFIG_FIELDS = frozenset(_CONFIG_FIELD_ORDER)
+_REQUIRED_DPSSHARE_FIELDS = frozenset({'dp_epsilon', 'dp_sensitivity', 'num_shares', 'threshold'})
+
+# Matches the numeric assignment of any editable field in config.py
+_CFG_RE = re.compile(r'^(\s*)(' + '|'.join(CONFIG_FIELDS) + r')(\s*=\s*)[0-9]*\.?[0-9]+', re.M)
+
+_CFG_LOCK = threading.Lock()
+
+def _rewrite_config(mapping):
+    """Rewrite the given Config fields in config.py in a single substitution pass"""
+    def _sub(m):
+        name = m.group(2)
+        if name not in mapping:
+            return m.group(0)
+        return f"{m.group(1)}{name}{m.group(3)}{mapping[name]}"
+    # Serialize writers; readers never see a torn file thanks to the atomic rename
+    with _CFG_LOCK:
+        with open('config.py') as f:
+            config_content = _CFG_RE.sub(_sub, f.read())
+        with open('config.py.tmp', 'w') as f:
+            f.write(config_content)
+        os.replace('config.py.tmp', 'config.py')
+
+# Log directory per algorithm; {c} is the client count and {s} the server count
+_LOG_DIR_FMT = {
+    'fedshare': 'logs/fedshare-mnist-client-{c}-server-{s}',
+    'fedavg': 'logs/fedavg-mnist-client-{c}',
+    'scotch': 'logs/scotch-mnist-client-{c}-server-{s}',
+    'dpsshare': 'logs/dpsshare-mnist-client-{c}-server-{s}',
+}
+
+def log_dir_for(algorithm):
+    """Return the log directory of an algorithm for the current config"""
+    cfg = _get_config()
+    return _LOG_DIR_FMT[algorithm].format(c=cfg['number_of_clients'], s=cfg['num_servers'])
+
+# Progress parsing works on raw log bytes; patterns are compiled once
+ROUND_RE = re.compile(rb'Round: (\d+)/\d+')
+# Anchored on the literal so the scan can skip ahead; the leading "* " of the
+# "*** Round N completed ***" banner is checked per hit in count_round_banners.
+ROUND_COMPLETED_RE = re.compile(rb'Round \d+ completed \*')
+ROUND_N_COMPLETED_RE = re.compile(rb'Round (\d+) completed')
+ACC_RE = re.compile(rb'accuracy: ([\d.]+)')
+LOSS_RE = re.compile(rb'loss: ([\d.]+)')
+_NUMBER = rb'\s+([0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?)'
+GLOBAL_LOSS_RE = re.compile('📊 Global Test Loss:'.encode() + _NUMBER)
+GLOBAL_ACC_RE = re.compile('🎯 Global Test Accuracy:'.encode() + _NUMBER)
+# Latest metrics are near the end of a log, so search there before scanning everything
+PROGRESS_TAIL_BYTES = 8192
+
+def last_match(pattern, content, tail=PROGRESS_TAIL_BYTES):
+    """Return group 1 of the last match of pattern in content, or None"""
+    last = None
+    for m in pattern.finditer(content, max(0, len(content) - tail)):
+        last = m
+    if last is None and len(content) > tail:
+        for m in pattern.finditer(content):
+            last = m
+    return last.group(1) if last else None
+
+def count_round_banners(content):
+    """Count "*** Round N completed ***" banners in content"""
+    return sum(1 for m in ROUND_COMPLETED_RE.finditer(content)
+               if content[max(0, m.start() - 2):m.start()] == b'* ')
+
+def global_metrics(content):
+    """Return the latest global test loss/accuracy found in a log"""
+    found = {}
+    loss = last_match(GLOBAL_LOSS_RE, content)
+    accuracy = last_match(GLOBAL_ACC_RE, content)
+    if loss is not None:
+        found['global_loss'] = float(loss)
+    if accuracy is not None:
+        found['global_accuracy'] = float(accuracy)
+    return found
+
+def new_client_state():
+    return {'round': 0, 'finished': False, 'completed_rounds': 0, 'accuracy': None, 'loss': None, 'global': {}}
+
+def update_client_state(state, data):
+    """Fold new client log lines into its round, completion and metric state"""
+    state['round'] = max(state['round'], max((int(m.group(1)) for m in ROUND_RE.finditer(data)), default=0))
+    state['finished'] = state['finished'] or b'Training finished' in data
+    state['completed_rounds'] += count_round_banners(data)
+    accuracy = last_match(ACC_RE, data)
+    loss = last_match(LOSS_RE, data)
+    if accuracy is not None:
+        state['accuracy'] = float(accuracy)
+    if loss is not None:
+        state['loss'] = float(loss)
+    state['global'].update(global_metrics(data))
+
+def new_server_state():
+    return {'rounds_completed': set(), 'aggregations': 0, 'global': {}}
+
+def update_server_state(state, data):
+    """Fold new server log lines into its aggregation and metric state"""
+    state['rounds_completed'].update(ROUND_N_COMPLETED_RE.findall(data))
+    state['aggregations'] += data.count(b'Round completed')
+    state['global'].update(global_metrics(data))
+
+def new_lead_state():
+    return {'aggregated': False, 'global': {}}
+
+def update_lead_state(state, data):
+    """Fold new lead server log lines into its completion and metric state"""
+    state['aggregated'] = state['aggregated'] or b'Model aggregation completed successfully' in data
+    state['global'].update(global_metrics(data))
+
+# Incremental parse state per log path; only bytes appended since the last poll are read.
+# Assembled progress per algorithm -> (key, progress), keyed by every file's stat signature.
+_log_states = {}
+_log_state_lock = threading.Lock()
+_progress_cache = {}
+_progress_bodies = {}  # algorithm -> (progress, JSON body, ETag) last served
+
+def _stat_sig(path, name, present):
+    """Return (mtime_ns, size, inode) of path, or None if its name is not in present"""
+    if name not in present:
+        return None
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def _log_state(path, sig, new_state, update):
+    """Return the parse state of path, feeding it whatever was appended since the last call"""
+    with _log_state_lock:
+        state = _log_states.get(path)
+        if state is not None and state['sig'] == sig:
+            return state['view']
+        if state is None or state['ino'] != sig[2] or sig[1] < state['offset']:
+            # New, replaced or truncated file: start over
+            state = {'offset': 0, 'ino': sig[2], 'pending': b'', 'parsed': new_state()}
+        with open(path, 'rb') as f:
+            f.seek(state['offset'])
+            data = state['pending'] + f.read()
+            state['offset'] = f.tell()
+        # Only whole lines enter the running state; a trailing partial line is applied to a copy
+        cut = data.rfind(b'\n') + 1
+        if cut:
+            update(state['parsed'], data[:cut])
+        state['pending'] = data[cut:]
+        view = state['parsed']
+        if state['pending']:
+            view = copy.deepcopy(view)
+            update(view, state['pending'])
+        state['view'] = view
+        state['sig'] = sig
+        _log_states[path] = state
+        return view
+
+def clear_progress_cache(algorithm):
+    """Forget parsed progress for an algorithm whose logs are being replaced"""
+    _progress_cache.pop(algorithm, None)
+    prefix = f"logs/{algorithm}-"
+    with _log_state_lock:
+        for path in [p for p in _log_states if p.startswith(prefix)]:
+            del _log_states[path]
+
+def assemble_progress(progress, client_logs, client_sigs, server_log, server_sig,
+                      lead_server_log, lead_sig, total_rounds):
+    """Fold the per-file log summaries into the progress dict"""
+    # Check client logs for training progress
+    for i, (client_log, sig) in enumerate(zip(client_logs, client_sigs)):
+        if sig is None:
+            continue
+        progress['clients_started'] += 1
+        try:
+            summary = _log_state(client_log, sig, new_client_state, update_client_state)
+        except Exception as e:
+            print(f"Error reading client log {client_log}: {e}")
+            continue
+        
+        progress['current_round'] = max(progress['current_round'], summary['round'])
+        
+        # If training is finished, set to 100%, otherwise calculate based on actual total rounds
+        if summary['finished']:
+            progress['training_progress'] = 100
+            progress['status'] = 'completed'
+        elif summary['completed_rounds'] > 0:
+            round_progress = min(100, (summary['completed_rounds'] / max(1, total_rounds)) * 100) if total_rounds > 0 else 0
+            progress['training_progress'] = max(progress['training_progress'], round_progress)
+            progress['status'] = 'training'
+        
+        if summary['accuracy'] is not None:
+            progress['metrics'][f'client_{i}_accuracy'] = summary['accuracy']
+        if summary['loss'] is not None:
+            progress['metrics'][f'client_{i}_loss'] = summary['loss']
+        progress['metrics'].update(summary['global'])
     
-    # Get current configuration values
-    total_clients = config.Config.number_of_clients
-    total_rounds = config.Config.training_rounds
-    num_servers = config.Config.num_servers
+    # Check server logs for completion
+    if server_sig is not None:
+        try:
+            summary = _log_state(server_log, server_sig, new_server_state, update_server_state)
+            if str(total_rounds).encode() in summary['rounds_completed']:
+                progress['training_progress'] = 100
+            else:
+                aggregation_progress = min(100, (summary['aggregations'] / max(1, total_rounds)) * 100) if total_rounds > 0 else 0
+                progress['training_progress'] = max(progress['training_progress'], aggregation_progress)
+            progress['metrics'].update(summary['global'])
+        except Exception as e:
+            print(f"Error reading server log: {e}")
     
-    # Generate dynamic log directory names based on current config
-    if algorithm == 'fedavg':
-        log_dir_name = f"fedavg-mnist-client-{total_clients}"
-    else:
-        log_dir_name = f"{algorithm}-mnist-client-{total_clients}-server-{num_servers}"
+    # Check lead server for completion
+    if lead_sig is not None:
+        try:
+            summary = _log_state(lead_server_log, lead_sig, new_lead_state, update_lead_state)
+            if summary['aggregated']:
+                progress['training_progress'] = 100
+            progress['metrics'].update(summary['global'])
+        except Exception as e:
+            print(f"Error reading lead server log: {e}")
     
-    log_dir = f"logs/{log_dir_name}"
+    return progress
+
+# Server log names differ per algorithm; everything else follows one pattern
+_SERVER_LOG_NAME = {'fedavg': 'fedavgserver.log'}
+_progress_paths = {}
+
+def progress_log_paths(algorithm, log_dir, total_clients):
+    """Return (client log paths, client log names, server log, lead server log), built once per config"""
+    key = (algorithm, log_dir, total_clients)
+    paths = _progress_paths.get(key)
+    if paths is None:
+        client_names = [f"{algorithm}client-{i}.log" for i in range(total_clients)]
+        paths = ([f"{log_dir}/{name}" for name in client_names], client_names,
+                 f"{log_dir}/{_SERVER_LOG_NAME.get(algorithm, f'{algorithm}server-0.log')}",
+                 f"{log_dir}/{algorithm}leadserver.log")
+        _progress_paths[key] = paths
+    return paths
+
+def parse_logs_for_progress(algorithm):
+    """Parse log files to extract training progress"""
+    # Get current configuration values
+    cfg = _get_config()
+    total_clients = cfg['number_of_clients']
+    total_rounds = cfg['training_rounds']
+    num_servers = cfg['num_servers']
     
-    if algorithm not in ['fedshare', 'fedavg', 'scotch', 'dpsshare']:
+    if algorithm not in _VALID_ALGOS:
         return {}
+    
+    log_dir = log_dir_for(algorithm)
         
     progress = {
         'clients_started': 0,
@@ -98,109 +509,27 @@ def parse_logs_for_progress(algorithm):
         'metrics': {}
     }
     
-    if not os.path.exists(log_dir):
+    # One directory read tells which logs exist; only those are stat'ed
+    try:
+        with os.scandir(log_dir) as entries:
+            present = {entry.name for entry in entries}
+    except FileNotFoundError:
         return progress
     
-    # Check client logs for training progress
-    for i in range(total_clients):
-        client_log = f"{log_dir}/{algorithm}client-{i}.log"
-        if os.path.exists(client_log):
-            progress['clients_started'] += 1
-            try:
-                with open(client_log, 'r') as f:
-                    content = f.read()
-                    
-                # Extract round information
-                rounds = re.findall(r'Round: (\d+)/(\d+)', content)
-                if rounds:
-                    latest_round = max([int(r[0]) for r in rounds])
-                    progress['current_round'] = max(progress['current_round'], latest_round)
-                
-                # Extract training completion - look for specific patterns
-                training_finished = 'Training finished' in content
-                
-                # Count actual round completions more accurately
-                round_completion_matches = re.findall(r'\*+ Round \d+ completed \*+', content)
-                completed_rounds = len(round_completion_matches)
-                
-                # If training is finished, set to 100%, otherwise calculate based on actual total rounds
-                if training_finished:
-                    progress['training_progress'] = 100
-                    progress['status'] = 'completed'
-                elif completed_rounds > 0:
-                    # Calculate percentage based on actual total rounds
-                    round_progress = min(100, (completed_rounds / max(1, total_rounds)) * 100) if total_rounds > 0 else 0
-                    progress['training_progress'] = max(progress['training_progress'], round_progress)
-                    progress['status'] = 'training'
-                
-                # Extract accuracy/loss if available
-                accuracy_matches = re.findall(r'accuracy: ([\d.]+)', content)
-                loss_matches = re.findall(r'loss: ([\d.]+)', content)
-                if accuracy_matches:
-                    progress['metrics'][f'client_{i}_accuracy'] = float(accuracy_matches[-1])
-                if loss_matches:
-                    progress['metrics'][f'client_{i}_loss'] = float(loss_matches[-1])
-                
-                # Extract global performance metrics if available
-                global_loss_matches = re.findall(r'📊 Global Test Loss:\s+([0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?)', content)
-                global_accuracy_matches = re.findall(r'🎯 Global Test Accuracy:\s+([0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?)', content)
-                if global_loss_matches:
-                    progress['metrics']['global_loss'] = float(global_loss_matches[-1])
-                if global_accuracy_matches:
-                    progress['metrics']['global_accuracy'] = float(global_accuracy_matches[-1])
-                    
-            except Exception as e:
-                print(f"Error reading client log {client_log}: {e}")
-    
-    # Check server logs for completion
-    server_log = f"{log_dir}/{algorithm}server.log" if algorithm == 'fedavg' else f"{log_dir}/{algorithm}server-0.log"
-    if os.path.exists(server_log):
-        try:
-            with open(server_log, 'r') as f:
-                content = f.read()
-                
-            # Check for final round completion
-            final_round_completed = f"Round {progress['total_rounds']} completed" in content
-            if final_round_completed:
-                progress['training_progress'] = 100
-            else:
-                # Extract server aggregation info - calculate based on actual total rounds
-                aggregations = content.count('Round completed')
-                aggregation_progress = min(100, (aggregations / max(1, total_rounds)) * 100) if total_rounds > 0 else 0
-                progress['training_progress'] = max(progress['training_progress'], aggregation_progress)
-            
-            # Extract global performance metrics from server logs
-            global_loss_matches = re.findall(r'📊 Global Test Loss:\s+([0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?)', content)
-            global_accuracy_matches = re.findall(r'🎯 Global Test Accuracy:\s+([0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?)', content)
-            if global_loss_matches:
-                progress['metrics']['global_loss'] = float(global_loss_matches[-1])
-            if global_accuracy_matches:
-                progress['metrics']['global_accuracy'] = float(global_accuracy_matches[-1])
-                
-        except Exception as e:
-            print(f"Error reading server log: {e}")
+    client_logs, client_names, server_log, lead_server_log = progress_log_paths(algorithm, log_dir, total_clients)
+    client_sigs = [_stat_sig(path, name, present) for path, name in zip(client_logs, client_names)]
+    server_sig = _stat_sig(server_log, os.path.basename(server_log), present)
+    lead_sig = _stat_sig(lead_server_log, os.path.basename(lead_server_log), present)
     
-    # Check lead server for completion
-    lead_server_log = f"{log_dir}/{algorithm}leadserver.log"
-    if os.path.exists(lead_server_log):
-        try:
-            with open(lead_server_log, 'r') as f:
-                content = f.read()
-                
-            # Check for successful aggregation completion
-            if 'Model aggregation completed successfully' in content:
-                progress['training_progress'] = 100
-            
-            # Extract global performance metrics from lead server logs
-            global_loss_matches = re.findall(r'📊 Global Test Loss:\s+([0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?)', content)
-            global_accuracy_matches = re.findall(r'🎯 Global Test Accuracy:\s+([0-9]*\.?[0-9]+(?:[eE][+-]?[0-9]+)?)', content)
-            if global_loss_matches:
-                progress['metrics']['global_loss'] = float(global_loss_matches[-1])
-            if global_accuracy_matches:
-                progress['metrics']['global_accuracy'] = float(global_accuracy_matches[-1])
-                
-        except Exception as e:
-            print(f"Error reading lead server log: {e}")
+    # Nothing changed since the last poll: reuse the assembled progress
+    key = (log_dir, total_rounds, tuple(client_sigs), server_sig, lead_sig)
+    cached = _progress_cache.get(algorithm)
+    if cached is not None and cached[0] == key:
+        progress = dict(cached[1])
+    else:
+        progress = assemble_progress(progress, client_logs, client_sigs, server_log, server_sig,
+                                     lead_server_log, lead_sig, total_rounds)
+        _progress_cache[algorithm] = (key, dict(progress))
     
     # Determine overall status - check completion FIRST
     if progress['clients_started'] == 0:
@@ -218,9 +547,9 @@ def parse_logs_for_progress(algorithm):
                     'clients': total_clients,
                     'servers': num_servers,
                     'rounds': total_rounds,
-                    'batch_size': config.Config.batch_size,
-                    'dataset_size': config.Config.train_dataset_size,
-                    'epochs': config.Config.epochs
+                    'batch_size': cfg['batch_size'],
+                    'dataset_size': cfg['train_dataset_size'],
+                    'epochs': cfg['epochs']
                 }
                 
                 save_algorithm_result(algorithm, config_data, progress['metrics'])
@@ -234,48 +563,158 @@ def parse_logs_for_progress(algorithm):
     
     return progress
 
-class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
-    def do_POST(self):
-        if self.path == '/config':
-            self.update_config()
-        elif self.path == '/dpsshare_config':
-            self.update_dpsshare_config()
-        else:
-            self.send_error(404, "Not Found")
-    
-    def do_GET(self):
-        if self.path == '/':
-            self.serve_homepage()
-        elif self.path == '/favicon.ico':
-            self.send_response(204)  # No Content
-            self.end_headers()
-        elif self.path == '/reinitialize':
-            self.reinitialize_all()
-        elif self.path.startswith('/run/'):
-            algorithm = self.path.split('/')[-1]
-            self.run_algorithm(algorithm)
-        elif self.path.startswith('/progress/'):
-            algorithm = self.path.split('/')[-1]
-            self.get_progress(algorithm)
-        elif self.path.startswith('/logs/'):
-            algorithm = self.path.split('/')[-1]
-            self.show_logs(algorithm)
-        elif self.path.startswith('/status/'):
-            algorithm = self.path.split('/')[-1]
-            self.get_status(algorithm)
-        elif self.path == '/current_config':
-            self.get_current_config()
-        elif self.path == '/results':
-            self.get_results()
-        elif self.path == '/comparison':
-            self.show_comparison()
-        elif self.path == '/clear_results':
-            self.clear_results()
-        else:
-            super().do_GET()
-    
-    def serve_homepage(self):
-        html = """<!DOCTYPE html>
+def progress_body(algorithm):
+    """Return the progress of an algorithm as (JSON bytes, ETag), re-encoding only when it changed"""
+    progress = parse_logs_for_progress(algorithm)
+    cached = _progress_bodies.get(algorithm)
+    if cached is not None and cached[0] == progress:
+        return cached[1], cached[2]
+    body = json.dumps(progress).encode()
+    etag = '"%08x"' % zlib.crc32(body)
+    _progress_bodies[algorithm] = (progress, body, etag)
+    return body, etag
+
+# Log viewer only renders the tail of each file, read in small chunks
+# (the raw link serves the whole file)
+LOG_TAIL_BYTES = 128 * 1024
+LOG_READ_CHUNK = 8192
+LOG_WRITE_BUFFER = 64 * 1024
+LOG_STREAM_INTERVAL = 1  # Seconds between checks for appended log lines
+LOG_STREAM_KEEPALIVE = 15
+LOG_STREAM_MAX_SECONDS = 600
+PROGRESS_POLL_INTERVAL = 1  # Seconds between log checks when watchfiles is unavailable
+PROGRESS_HEARTBEAT = 5
+PROGRESS_STREAM_MAX_SECONDS = 600
+KEEPALIVE_TIMEOUT = 15
+
+# Keyword highlighting applied to escaped log bytes in a single regex pass; the
+# markup is ASCII, so the bytes never need a decode/encode round trip
+_HL_MAP = {
+    b'Round:': b'<strong>Round:</strong>',
+    b'accuracy:': b'<span style="color: #2ecc71;"><strong>accuracy:</strong></span>',
+    b'loss:': b'<span style="color: #e74c3c;"><strong>loss:</strong></span>',
+    b'completed': b'<span style="color: #f39c12;"><strong>completed</strong></span>',
+}
+_HL_RE = re.compile(b'|'.join(map(re.escape, _HL_MAP)))
+
+def render_log_text(data):
+    """HTML-escape a block of log bytes and highlight important information"""
+    content = data.replace(b'&', b'&amp;').replace(b'<', b'&lt;').replace(b'>', b'&gt;')
+    return _HL_RE.sub(lambda m: _HL_MAP[m.group(0)], content)
+
+# Rendered log fragments keyed by (path, mtime_ns, size), reused across auto-refreshes
+LOG_RENDER_CACHE_SIZE = 64
+_log_render_cache = OrderedDict()
+_log_render_lock = threading.Lock()
+_LOG_TRUNCATED_NOTICE = f"<em>… (truncated, showing last {LOG_TAIL_BYTES // 1024} KB) …</em>\n".encode()
+
+def render_log_file(filename, filepath, raw_url):
+    """Render the tail of one log file as an HTML fragment, in fixed-size chunks"""
+    parts = []
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:  # Only show non-empty logs
+            return b''
+        if size > LOG_TAIL_BYTES:
+            f.seek(-LOG_TAIL_BYTES, os.SEEK_END)
+            f.readline()  # Drop the partial first line
+        
+        # data-offset tells the live stream where this snapshot ends
+        parts.append(f"""
+        <div class="log-file">
+            <div class="log-header">📄 {filename} <a href="{raw_url}" style="color: #bdc3c7; font-weight: normal;">raw</a></div>
+            <div class="log-content" data-file="{escape(filename)}" data-offset="{size}">""".encode())
+        if size > LOG_TAIL_BYTES:
+            parts.append(_LOG_TRUNCATED_NOTICE)
+        
+        # Cut chunks on line boundaries so highlighted keywords are never split
+        pending = b''
+        remaining = size - f.tell()
+        while remaining > 0 and (chunk := f.read(min(LOG_READ_CHUNK, remaining))):
+            remaining -= len(chunk)
+            pending += chunk
+            cut = pending.rfind(b'\n') + 1 or len(pending)
+            parts.append(render_log_text(pending[:cut]))
+            pending = pending[cut:]
+        if pending:
+            parts.append(render_log_text(pending))
+        
+        parts.append(b"""</div>
+        </div>""")
+    return b''.join(parts)
+
+# Static chrome of the log viewer, encoded once per algorithm
+_LOG_HEAD_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>{algo} Training Logs</title>
+    <style>
+        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 20px; background-color: #f5f5f5; }}
+        .container {{ background: white; padding: 30px; border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }}
+        .back-btn {{ background: linear-gradient(145deg, #95a5a6, #7f8c8d); color: white; padding: 12px 24px; 
+                     border: none; border-radius: 8px; text-decoration: none; display: inline-block; margin-bottom: 20px; }}
+        .log-file {{ margin: 20px 0; border: 1px solid #ddd; border-radius: 10px; overflow: hidden; }}
+        .log-header {{ background: linear-gradient(145deg, #34495e, #2c3e50); color: white; padding: 15px; font-weight: bold; }}
+        .log-content {{ background-color: #2c3e50; color: #ecf0f1; padding: 20px; 
+                        font-family: 'Courier New', monospace; font-size: 13px; max-height: 400px; 
+                        overflow-y: auto; white-space: pre-wrap; line-height: 1.4; }}
+        .refresh-btn {{ float: right; background: linear-gradient(145deg, #3498db, #2980b9); color: white; 
+                       padding: 8px 16px; border: none; border-radius: 6px; cursor: pointer; }}
+    </style>
+    <script>
+        function refreshLogs() {{ location.reload(); }}
+    </script>
+</head>
+<body>
+    <div class="container">
+        <a href="/" class="back-btn">← Back to Main</a>
+        <button class="refresh-btn" onclick="refreshLogs()">🔄 Refresh</button>
+        <h1>📋 {algo} Training Logs</h1>"""
+
+_LOG_EMPTY_TEMPLATE = """<div style="text-align: center; color: #666; padding: 40px; font-style: italic;">
+                No logs found for {algo}.<br>
+                <strong>Run the algorithm first to generate training logs.</strong>
+            </div>"""
+
+# Live updates: appended log lines arrive over Server-Sent Events; full reload is the fallback
+_LOG_PAGE_FOOTER = """
+    </div>
+    <script>
+        (function () {
+            if (!window.EventSource) {
+                setInterval(refreshLogs, 15000);
+                return;
+            }
+            const params = new URLSearchParams();
+            document.querySelectorAll('.log-content[data-file]').forEach(el => {
+                params.append(el.dataset.file, el.dataset.offset);
+            });
+            const source = new EventSource(location.pathname + '/stream?' + params);
+            source.addEventListener('append', event => {
+                const msg = JSON.parse(event.data);
+                const el = document.querySelector('.log-content[data-file="' + CSS.escape(msg.file) + '"]');
+                if (!el) {
+                    refreshLogs();
+                    return;
+                }
+                const atBottom = el.scrollTop + el.clientHeight >= el.scrollHeight - 5;
+                el.insertAdjacentHTML('beforeend', msg.html);
+                if (atBottom) el.scrollTop = el.scrollHeight;
+            });
+            source.addEventListener('reload', refreshLogs);
+            source.onerror = () => {
+                source.close();
+                setTimeout(refreshLogs, 15000);
+            };
+        })();
+    </script>
+</body>
+</html>""".encode()
+
+_LOG_HEAD_BYTES = {a: _LOG_HEAD_TEMPLATE.format(algo=a.upper()).encode() for a in _VALID_ALGOS}
+_LOG_EMPTY_BYTES = {a: _LOG_EMPTY_TEMPLATE.format(algo=a.upper()).encode() for a in _VALID_ALGOS}
+
+HOMEPAGE_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -611,6 +1050,7 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
     </style>
     <script>
         let updateIntervals = {};
+        let progressSources = {};
         let completionCounters = {};
         
         function runAlgorithm(algorithm) {
@@ -635,8 +1075,14 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
         }
         
         function startProgressTracking(algorithm) {
-            if (updateIntervals[algorithm]) {
-                clearInterval(updateIntervals[algorithm]);
+            stopProgressTracking(algorithm);
+            
+            // Prefer server-pushed updates; poll only where EventSource is unavailable
+            if (window.EventSource) {
+                const source = new EventSource('/events/' + algorithm);
+                source.onmessage = event => updateProgressUI(algorithm, JSON.parse(event.data));
+                progressSources[algorithm] = source;
+                return;
             }
             
             updateIntervals[algorithm] = setInterval(() => {
@@ -646,6 +1092,17 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
             updateProgress(algorithm);
         }
         
+        function stopProgressTracking(algorithm) {
+            if (updateIntervals[algorithm]) {
+                clearInterval(updateIntervals[algorithm]);
+                delete updateIntervals[algorithm];
+            }
+            if (progressSources[algorithm]) {
+                progressSources[algorithm].close();
+                delete progressSources[algorithm];
+            }
+        }
+        
         function updateProgress(algorithm) {
             fetch('/progress/' + algorithm)
                 .then(response => response.json())
@@ -695,19 +1152,18 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                     statusMessage = '✅ Training completed successfully!';
                     statusClass = 'status-completed';
                     
-                    // Initialize completion tracking
+                    // Initialize completion tracking (time of the first completed update)
                     if (!completionCounters[algorithm]) {
-                        completionCounters[algorithm] = 0;
+                        completionCounters[algorithm] = Date.now();
                     }
-                    completionCounters[algorithm]++;
                     
                     // Check if global metrics are present
                     const hasGlobalMetrics = data.metrics && (data.metrics.global_loss !== undefined || data.metrics.global_accuracy !== undefined);
-                    const maxWaitCycles = 15; // 30 seconds max wait
+                    const maxWaitMs = 30000; // 30 seconds max wait
                     
-                    if (hasGlobalMetrics || completionCounters[algorithm] >= maxWaitCycles) {
-                        // Global metrics found or timeout reached - stop polling
-                        clearInterval(updateIntervals[algorithm]);
+                    if (hasGlobalMetrics || Date.now() - completionCounters[algorithm] >= maxWaitMs) {
+                        // Global metrics found or timeout reached - stop tracking
+                        stopProgressTracking(algorithm);
                         runBtn.textContent = 'Run ' + algorithm.charAt(0).toUpperCase() + algorithm.slice(1);
                         runBtn.style.background = 'linear-gradient(145deg, #3498db, #2980b9)';
                         runBtn.disabled = false;
@@ -1196,50 +1652,194 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
     </div>
 </body>
 </html>"""
-        
+
+_SCRIPT_BLOCK_RE = re.compile(r'(<script\b.*?</script>)', re.S)
+
+def _minify_html(text):
+    """Strip indentation from an HTML page, leaving <script> blocks untouched"""
+    parts = _SCRIPT_BLOCK_RE.split(text)
+    for i in range(0, len(parts), 2):
+        fragment = re.sub(r'\n\s+', '\n', parts[i])
+        parts[i] = fragment.replace('>\n<', '><')
+    return ''.join(parts)
+
+# Minified and encoded once at import time; served as-is on every GET /
+_INDEX_HTML = _minify_html(HOMEPAGE_HTML).encode()
+
+class ChunkedWriter(io.RawIOBase):
+    """Write-only stream that frames each write as an HTTP/1.1 chunk; close() ends the body"""
+    def __init__(self, wfile):
+        self._wfile = wfile
+    
+    def writable(self):
+        return True
+    
+    def write(self, data):
+        if data:
+            self._wfile.write(b''.join((b'%x\r\n' % len(data), data, b'\r\n')))
+        return len(data)
+    
+    def close(self):
+        if not self.closed:
+            super().close()
+            self._wfile.write(b'0\r\n\r\n')
+
+class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep-alive: every response carries Content-Length or is sent chunked
+    protocol_version = 'HTTP/1.1'
+    # Idle keep-alive connections give their pooled worker back after this many seconds;
+    # writes to a stalled client raise TimeoutError, which the event streams treat as a disconnect
+    timeout = KEEPALIVE_TIMEOUT
+    # Exact-path routes, resolved with a single dict lookup
+    _POST_ROUTES = {
+        '/config': 'update_config',
+        '/dpsshare_config': 'update_dpsshare_config',
+    }
+    _GET_ROUTES = {
+        '/': 'serve_homepage',
+        '/favicon.ico': 'serve_favicon',
+        '/reinitialize': 'reinitialize_all',
+        '/current_config': 'get_current_config',
+        '/results': 'get_results',
+        '/comparison': 'show_comparison',
+        '/clear_results': 'clear_results',
+    }
+    # Per-algorithm routes: /<prefix>/<algorithm>
+    _ALGO_ROUTES = {
+        'run': 'run_algorithm',
+        'progress': 'get_progress',
+        'events': 'stream_progress',
+        'logs': 'show_logs',
+        'status': 'get_status',
+    }
+    _ALGO_ROUTE_RE = re.compile(r'/(' + '|'.join(_ALGO_ROUTES) + r')/')
+    # Live log updates: /logs/<algorithm>/stream?<file>=<offset>&...
+    _LOG_STREAM_RE = re.compile(r'/logs/(' + '|'.join(_VALID_ALGOS) + r')/stream(?:\?(.*))?$')
+    # Plain-text tail of a single log file: /logs/<algorithm>/<file>.log
+    _RAW_LOG_RE = re.compile(r'/logs/(' + '|'.join(_VALID_ALGOS) + r')/([^/]+\.log)$')
+    
+    def do_POST(self):
+        handler = self._POST_ROUTES.get(self.path)
+        if handler:
+            getattr(self, handler)()
+        else:
+            self.send_error(404, "Not Found")
+    
+    def do_GET(self):
+        handler = self._GET_ROUTES.get(self.path)
+        if handler:
+            getattr(self, handler)()
+            return
+        m = self._LOG_STREAM_RE.match(self.path)
+        if m:
+            self.stream_logs(m.group(1), m.group(2) or '')
+            return
+        m = self._RAW_LOG_RE.match(self.path)
+        if m:
+            self.send_raw_log(m.group(1), m.group(2))
+            return
+        m = self._ALGO_ROUTE_RE.match(self.path)
+        if m:
+            algorithm = self.path.split('/')[-1]
+            getattr(self, self._ALGO_ROUTES[m.group(1)])(algorithm)
+        else:
+            super().do_GET()
+    
+    def serve_favicon(self):
+        self.send_response(204)  # No Content
+        self.end_headers()
+    
+    def serve_homepage(self):
         self.send_response(200)
         self.send_header('Content-type', 'text/html')
         self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
         self.send_header('Pragma', 'no-cache')
         self.send_header('Expires', '0')
+        self.send_header('Content-Length', str(len(_INDEX_HTML)))
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(_INDEX_HTML)
     
     def get_progress(self, algorithm):
         """Get real-time progress for an algorithm"""
-        progress = parse_logs_for_progress(algorithm)
+        body, etag = progress_body(algorithm)
+        
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            return
         
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Cache-Control', 'no-cache')
+        self.send_header('ETag', etag)
         self.end_headers()
-        self.wfile.write(json.dumps(progress).encode())
+        self.wfile.write(body)
+    
+    def stream_progress(self, algorithm):
+        """Push progress updates as Server-Sent Events whenever the algorithm's logs change"""
+        if algorithm not in _VALID_ALGOS:
+            self.send_error(404, "Invalid algorithm")
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        
+        stream = ChunkedWriter(self.wfile)
+        started = time.monotonic()
+        last_body = None
+        last_sent = 0
+        try:
+            for _ in self._log_dir_changes(log_dir_for(algorithm), started):
+                body = progress_body(algorithm)[0]
+                # Resend unchanged progress now and then so the page's completion timeout can run
+                if body != last_body or time.monotonic() - last_sent >= PROGRESS_HEARTBEAT:
+                    stream.write(b'data: %s\n\n' % body)
+                    last_body = body
+                    last_sent = time.monotonic()
+            # Ending the response; EventSource reconnects on its own
+            stream.close()
+        except (BrokenPipeError, ConnectionResetError, TimeoutError):
+            self.close_connection = True
+    
+    @staticmethod
+    def _log_dir_changes(log_dir, started):
+        """Yield once up front, then whenever log_dir changes or a heartbeat is due"""
+        yield
+        while time.monotonic() - started < PROGRESS_STREAM_MAX_SECONDS:
+            if watchfiles is not None and os.path.isdir(log_dir):
+                try:
+                    for _ in watchfiles.watch(log_dir, debounce=200, rust_timeout=PROGRESS_HEARTBEAT * 1000,
+                                              yield_on_timeout=True):
+                        yield
+                        if time.monotonic() - started >= PROGRESS_STREAM_MAX_SECONDS:
+                            return
+                except (OSError, RuntimeError):
+                    pass  # Directory removed while watching; fall back to polling below
+            time.sleep(PROGRESS_POLL_INTERVAL)
+            yield
     
     def run_algorithm(self, algorithm):
-        if algorithm not in ['fedshare', 'fedavg', 'scotch', 'dpsshare']:
+        if algorithm not in _VALID_ALGOS:
             self.send_error(400, "Invalid algorithm")
             return
         
         # Kill any existing processes first
-        subprocess.run(['pkill', '-f', f'{algorithm}'], capture_output=True)
-        time.sleep(1)
-        
+        terminate_matching(algorithm)
+
         # Clean up old logs - generate dynamic log directory names
-        import importlib
-        import config
-        importlib.reload(config)
-        
-        total_clients = config.Config.number_of_clients
-        num_servers = config.Config.num_servers
-        
-        if algorithm == 'fedavg':
-            log_dir_name = f"fedavg-mnist-client-{total_clients}"
-        else:
-            log_dir_name = f"{algorithm}-mnist-client-{total_clients}-server-{num_servers}"
-        
-        log_dir_path = f"logs/{log_dir_name}"
-        subprocess.run(['rm', '-rf', log_dir_path], capture_output=True)
+        cfg = _get_config()
+        total_clients = cfg['number_of_clients']
+        num_servers = cfg['num_servers']
+        log_dir_path = log_dir_for(algorithm)
+        shutil.rmtree(log_dir_path, ignore_errors=True)
         os.makedirs(log_dir_path, exist_ok=True)
+        clear_progress_cache(algorithm)
         
         try:
             if algorithm == 'fedshare':
@@ -1247,29 +1847,28 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                 self.start_fedshare_processes(log_dir_path, total_clients, num_servers)
             else:
                 # For other algorithms, use the original shell script approach
-                script_map = {
-                    'fedavg': './start-fedavg.sh', 
-                    'scotch': './start-scotch.sh',
-                    'dpsshare': './start-dpsshare.sh'
-                }
-                script_path = script_map[algorithm]
+                script_path = _START_SCRIPTS[algorithm]
                 print(f"Starting {algorithm}: {script_path}")
                 
+                # Own process group, so the script and everything it spawns can be signalled together
                 process = subprocess.Popen(
                     ['/bin/bash', script_path],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    cwd='.'
+                    cwd='.',
+                    start_new_session=True
                 )
                 
                 running_processes[algorithm] = process
+                watch_process(algorithm, process)
                 progress_data[algorithm] = {'status': 'starting', 'start_time': time.time()}
                 print(f"Started {algorithm} with PID: {process.pid}")
             
             self.send_response(200)
             self.send_header('Content-type', 'text/plain')
+            self.send_header('Content-Length', str(len(_STARTED_MSG[algorithm])))
             self.end_headers()
-            self.wfile.write(f"{algorithm.upper()} started successfully!".encode())
+            self.wfile.write(_STARTED_MSG[algorithm])
             
         except Exception as e:
             print(f"Error starting {algorithm}: {str(e)}")
@@ -1277,8 +1876,6 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
     
     def start_fedshare_processes(self, log_dir_path, total_clients, num_servers):
         """Start FedShare processes directly without shell scripts"""
-        import socket
-        
         # Dictionary to track all spawned processes
         fedshare_processes = {}
         
@@ -1308,7 +1905,7 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                 stdout=log_file,
                 stderr=subprocess.STDOUT,
                 cwd='.',
-                preexec_fn=os.setsid if hasattr(os, 'setsid') else None
+                start_new_session=True
             )
             fedshare_processes['logger'] = {'process': process, 'log_file': log_file}
             print(f"Started logger server (PID: {process.pid})")
@@ -1320,7 +1917,7 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                 stdout=log_file,
                 stderr=subprocess.STDOUT,
                 cwd='.',
-                preexec_fn=os.setsid if hasattr(os, 'setsid') else None
+                start_new_session=True
             )
             fedshare_processes['lead'] = {'process': process, 'log_file': log_file}
             print(f"Started lead server (PID: {process.pid})")
@@ -1333,7 +1930,7 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                     stdout=log_file,
                     stderr=subprocess.STDOUT,
                     cwd='.',
-                    preexec_fn=os.setsid if hasattr(os, 'setsid') else None
+                    start_new_session=True
                 )
                 fedshare_processes[f'server_{i}'] = {'process': process, 'log_file': log_file}
                 print(f"Started server {i} (PID: {process.pid})")
@@ -1350,36 +1947,38 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                     stdout=log_file,
                     stderr=subprocess.STDOUT,
                     cwd='.',
-                    preexec_fn=os.setsid if hasattr(os, 'setsid') else None
+                    start_new_session=True
                 )
                 fedshare_processes[f'client_{i}'] = {'process': process, 'log_file': log_file}
                 print(f"Started client {i} (PID: {process.pid})")
             
             # Store all processes in the global running_processes dict
             running_processes['fedshare'] = fedshare_processes
+            watch_processes('fedshare', fedshare_processes)
             progress_data['fedshare'] = {'status': 'starting', 'start_time': time.time()}
             
             print("FedShare processes started successfully!")
             
             # Robust startup synchronization with health checks and retry logic
             def initiate_training():
-                import time
-                import threading
-                import requests
-                import socket
-                from config import Config
+                # Snapshot the config once; the retry loops below run per client per attempt
+                cfg = _cfg()
+                _base = cfg.client_base_port
+                _addr = cfg.client_address
+                health_urls = [f'http://{_addr}:{_base + i}/' for i in range(total_clients)]
+                start_urls = [f'http://{_addr}:{_base + i}/start' for i in range(total_clients)]
                 
                 def check_client_health(client_id, max_retries=30, delay=2):
                     """Check if client is healthy and ready to receive requests"""
-                    port = Config.client_base_port + client_id
-                    health_url = f'http://{Config.client_address}:{port}/'
+                    port = _base + client_id
+                    health_url = health_urls[client_id]
                     
                     for attempt in range(max_retries):
                         try:
                             # First check if port is accessible
                             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                             sock.settimeout(3)
-                            result = sock.connect_ex((Config.client_address, port))
+                            result = sock.connect_ex((_addr, port))
                             sock.close()
                             
                             if result == 0:
@@ -1402,8 +2001,7 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                 
                 def start_client_with_retry(client_id, max_retries=5):
                     """Start client with exponential backoff retry logic"""
-                    port = Config.client_base_port + client_id
-                    url = f'http://{Config.client_address}:{port}/start'
+                    url = start_urls[client_id]
                     
                     for attempt in range(max_retries):
                         try:
@@ -1452,21 +2050,21 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                 print("📋 Phase 2: Initiating training on all clients...")
                 start_results = {}
                 
-                # Use threading for parallel starts but collect results
+                # Start clients in parallel on the shared pool but collect results
                 def threaded_start(client_id, results_dict):
                     results_dict[client_id] = start_client_with_retry(client_id)
                 
-                threads = []
+                futures = []
                 for client_id in range(total_clients):
-                    thread = threading.Thread(target=threaded_start, args=(client_id, start_results))
-                    thread.daemon = True
-                    threads.append(thread)
-                    thread.start()
+                    futures.append(_BACKGROUND_POOL.submit(threaded_start, client_id, start_results))
                     time.sleep(0.5)  # Small stagger to avoid overwhelming the system
                 
-                # Wait for all threads to complete
-                for thread in threads:
-                    thread.join(timeout=60)  # 60 second timeout per thread
+                # Wait for all starts to complete
+                for future in futures:
+                    try:
+                        future.result(timeout=60)  # 60 second timeout per client
+                    except FuturesTimeoutError:
+                        pass
                 
                 # Phase 3: Verify all clients started successfully
                 print("📋 Phase 3: Verifying training initiation results...")
@@ -1486,10 +2084,8 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                 print(f"✅ Training initiated on {total_clients} clients with robust synchronization")
                 return True
             
-            # Start the training initiation in a separate thread
-            training_thread = threading.Thread(target=initiate_training)
-            training_thread.daemon = True
-            training_thread.start()
+            # Start the training initiation in the background
+            _BACKGROUND_POOL.submit(initiate_training)
             
         except Exception as e:
             # Clean up any started processes on error
@@ -1503,135 +2099,201 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
     
     def show_logs(self, algorithm):
         """Enhanced log viewer with better formatting"""
-        if algorithm not in ['fedshare', 'fedavg', 'scotch', 'dpsshare']:
+        if algorithm not in _VALID_ALGOS:
             self.send_error(404, "Invalid algorithm")
             return
         
-        # Import and reload config to get current values
-        import importlib
-        import config
-        importlib.reload(config)
+        log_dir = log_dir_for(algorithm)
         
-        # Generate dynamic log directory names based on current config
-        total_clients = config.Config.number_of_clients
-        num_servers = config.Config.num_servers
+        # Stat every log up front: the stats key both the page ETag and the fragment cache
+        log_files = []
+        try:
+            entries = sorted((e for e in os.scandir(log_dir) if e.name.endswith('.log')), key=lambda e: e.name)
+            dir_exists = True
+        except FileNotFoundError:
+            entries = []
+            dir_exists = False
+        for entry in entries:
+            try:
+                st = entry.stat()
+                key = (entry.path, st.st_mtime_ns, st.st_size)
+            except OSError:
+                key = (entry.path, None, None)
+            log_files.append((entry.name, key))
         
-        if algorithm == 'fedavg':
-            log_dir_name = f"fedavg-mnist-client-{total_clients}"
-        else:
-            log_dir_name = f"{algorithm}-mnist-client-{total_clients}-server-{num_servers}"
+        use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        etag = '"%08x%s"' % (zlib.crc32(repr((algorithm, log_dir, dir_exists, log_files)).encode()),
+                             '-gz' if use_gzip else '')
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
         
-        log_dir = f"logs/{log_dir_name}"
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('ETag', etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
         
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>{algorithm.upper()} Training Logs</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-        .container {{ background: white; padding: 30px; border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }}
-        .back-btn {{ background: linear-gradient(145deg, #95a5a6, #7f8c8d); color: white; padding: 12px 24px; 
-                     border: none; border-radius: 8px; text-decoration: none; display: inline-block; margin-bottom: 20px; }}
-        .log-file {{ margin: 20px 0; border: 1px solid #ddd; border-radius: 10px; overflow: hidden; }}
-        .log-header {{ background: linear-gradient(145deg, #34495e, #2c3e50); color: white; padding: 15px; font-weight: bold; }}
-        .log-content {{ background-color: #2c3e50; color: #ecf0f1; padding: 20px; 
-                        font-family: 'Courier New', monospace; font-size: 13px; max-height: 400px; 
-                        overflow-y: auto; white-space: pre-wrap; line-height: 1.4; }}
-        .refresh-btn {{ float: right; background: linear-gradient(145deg, #3498db, #2980b9); color: white; 
-                       padding: 8px 16px; border: none; border-radius: 6px; cursor: pointer; }}
-    </style>
-    <script>
-        function refreshLogs() {{ location.reload(); }}
-        setInterval(refreshLogs, 15000); // Auto-refresh every 15 seconds (less aggressive)
-    </script>
-</head>
-<body>
-    <div class="container">
-        <a href="/" class="back-btn">← Back to Main</a>
-        <button class="refresh-btn" onclick="refreshLogs()">🔄 Refresh</button>
-        <h1>📋 {algorithm.upper()} Training Logs</h1>"""
+        # Coalesce the many per-file fragments into 64 KiB chunks
+        buffered = io.BufferedWriter(ChunkedWriter(self.wfile), LOG_WRITE_BUFFER)
+        # Log pages are repetitive text: level 1 gets most of the ratio for little CPU
+        out = gzip.GzipFile(fileobj=buffered, mode='wb', compresslevel=1) if use_gzip else buffered
+        write = out.write
+        write(_LOG_HEAD_BYTES[algorithm])
         
-        if os.path.exists(log_dir):
-            log_files = [f for f in os.listdir(log_dir) if f.endswith('.log')]
-            log_files.sort()
-            
-            for filename in log_files:
-                filepath = os.path.join(log_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        content = f.read()
-                        if content.strip():  # Only show non-empty logs
-                            # Highlight important information
-                            content = content.replace('Round:', '<strong>Round:</strong>')
-                            content = content.replace('accuracy:', '<span style="color: #2ecc71;"><strong>accuracy:</strong></span>')
-                            content = content.replace('loss:', '<span style="color: #e74c3c;"><strong>loss:</strong></span>')
-                            content = content.replace('completed', '<span style="color: #f39c12;"><strong>completed</strong></span>')
-                            
-                    html += f"""
-        <div class="log-file">
-            <div class="log-header">📄 {filename}</div>
-            <div class="log-content">{content}</div>
-        </div>"""
-                except Exception as e:
-                    html += f"<p style='color: red;'>Error reading {filename}: {str(e)}</p>"
+        if dir_exists:
+            for filename, key in log_files:
+                with _log_render_lock:
+                    fragment = _log_render_cache.get(key)
+                    if fragment is not None:
+                        _log_render_cache.move_to_end(key)
+                if fragment is None:
+                    try:
+                        fragment = render_log_file(filename, key[0], f"/logs/{algorithm}/{filename}")
+                    except OSError as e:
+                        write(f"<p style='color: red;'>Error reading {filename}: {str(e)}</p>".encode())
+                        continue
+                    with _log_render_lock:
+                        _log_render_cache[key] = fragment
+                        if len(_log_render_cache) > LOG_RENDER_CACHE_SIZE:
+                            _log_render_cache.popitem(last=False)
+                write(fragment)
         else:
-            html += f"""<div style="text-align: center; color: #666; padding: 40px; font-style: italic;">
-                No logs found for {algorithm.upper()}.<br>
-                <strong>Run the algorithm first to generate training logs.</strong>
-            </div>"""
+            write(_LOG_EMPTY_BYTES[algorithm])
         
-        html += """
-    </div>
-</body>
-</html>"""
+        write(_LOG_PAGE_FOOTER)
+        if use_gzip:
+            out.close()  # Flushes the gzip trailer into the buffer
+        buffered.close()  # Sends the last chunk and the terminator; leaves the socket open
+    
+    def stream_logs(self, algorithm, query):
+        """Push lines appended to an algorithm's logs as Server-Sent Events"""
+        offsets = {}
+        for name, value in urllib.parse.parse_qsl(query):
+            if value.isdigit():
+                offsets[name] = int(value)
+        log_dir = log_dir_for(algorithm)
         
         self.send_response(200)
-        self.send_header('Content-type', 'text/html')
+        self.send_header('Content-type', 'text/event-stream')
         self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Transfer-Encoding', 'chunked')
         self.end_headers()
-        self.wfile.write(html.encode())
+        
+        stream = ChunkedWriter(self.wfile)
+        try:
+            self._stream_log_events(stream.write, log_dir, offsets)
+            stream.close()
+        except (BrokenPipeError, ConnectionResetError, TimeoutError):
+            self.close_connection = True
+    
+    @staticmethod
+    def _stream_log_events(write, log_dir, offsets):
+        """Write append/reload events for log_dir until a reload is due"""
+        started = last_write = time.monotonic()
+        while time.monotonic() - started < LOG_STREAM_MAX_SECONDS:
+            try:
+                entries = [e for e in os.scandir(log_dir) if e.name.endswith('.log')]
+            except FileNotFoundError:
+                entries = []
+            for entry in entries:
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                offset = offsets.get(entry.name)
+                if offset is None:
+                    if size == 0:
+                        continue
+                    # A log the page has not rendered yet: let the page pick it up
+                    write(b'event: reload\ndata: {}\n\n')
+                    return
+                if size < offset:
+                    write(b'event: reload\ndata: {}\n\n')  # Truncated by a new run
+                    return
+                if size == offset:
+                    continue
+                with open(entry.path, 'rb') as f:
+                    f.seek(offset)
+                    data = f.read(min(size - offset, LOG_TAIL_BYTES))
+                if len(data) < LOG_TAIL_BYTES:
+                    data = data[:data.rfind(b'\n') + 1]  # Only whole lines; the rest waits
+                else:
+                    # A full window always advances, even if it holds no newline at all
+                    data = data[:data.rfind(b'\n') + 1 or len(data)]
+                if not data:
+                    continue
+                offsets[entry.name] = offset + len(data)
+                payload = json.dumps({'file': entry.name, 'html': render_log_text(data).decode('utf-8', 'replace')})
+                write(f'event: append\ndata: {payload}\n\n'.encode())
+                last_write = time.monotonic()
+            if time.monotonic() - last_write >= LOG_STREAM_KEEPALIVE:
+                write(b': keepalive\n\n')
+                last_write = time.monotonic()
+            time.sleep(LOG_STREAM_INTERVAL)
+        # Bound how long one viewer holds a worker thread; the reload reconnects it
+        write(b'event: reload\ndata: {}\n\n')
+    
+    def send_raw_log(self, algorithm, filename):
+        """Send one whole log file as plain text, copied kernel-side with sendfile"""
+        filepath = os.path.join(log_dir_for(algorithm), filename)
+        try:
+            f = open(filepath, 'rb')
+        except (FileNotFoundError, NotADirectoryError):
+            self.send_error(404, "Log file not found")
+            return
+        with f:
+            offset = 0
+            count = os.fstat(f.fileno()).st_size
+            
+            self.send_response(200)
+            self.send_header('Content-type', 'text/plain; charset=utf-8')
+            self.send_header('Content-Length', str(count))
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            self.wfile.flush()
+            
+            # socket.sendfile uses os.sendfile and, unlike a bare loop, copes with socket timeouts
+            self.connection.sendfile(f, offset, count)
     
     def get_status(self, algorithm):
-        if algorithm in running_processes:
-            process = running_processes[algorithm]
-            if process.poll() is None:
-                status = {'status': 'running', 'pid': process.pid}
-            else:
-                status = {'status': 'completed', 'returncode': process.returncode}
-        else:
-            status = {'status': 'not_started'}
+        status = process_status.get(algorithm, {'status': 'not_started'})
+        body = json.dumps(status).encode()
         
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(status).encode())
+        self.wfile.write(body)
     
     def get_current_config(self):
         """Get current configuration from config.py"""
         try:
-            # Import config to get current values
-            import importlib
-            import config
-            importlib.reload(config)  # Reload to get latest values
-            
-            current_config = {
-                'number_of_clients': config.Config.number_of_clients,
-                'num_servers': config.Config.num_servers,
-                'training_rounds': config.Config.training_rounds,
-                'batch_size': config.Config.batch_size,
-                'train_dataset_size': config.Config.train_dataset_size,
-                'epochs': config.Config.epochs,
-                'dp_epsilon': config.Config.dp_epsilon,
-                'dp_sensitivity': config.Config.dp_sensitivity,
-                'num_shares': config.Config.num_shares,
-                'threshold': config.Config.threshold
-            }
+            _get_config()
+            body, etag = _config_cache['body'], _config_cache['etag']
+            
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                return
             
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
             self.send_header('Cache-Control', 'no-cache')
+            self.send_header('ETag', etag)
             self.end_headers()
-            self.wfile.write(json.dumps(current_config).encode())
+            self.wfile.write(body)
             
         except Exception as e:
             print(f"Error getting current config: {str(e)}")
@@ -1642,15 +2304,14 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
         try:
             # Get the request body
             content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            new_config = json.loads(post_data.decode('utf-8'))
+            new_config = json.loads(self.rfile.read(content_length))
             
             # Validate the configuration
-            required_fields = ['clients', 'rounds', 'batch_size', 'train_dataset_size', 'epochs']
-            for field in required_fields:
-                if field not in new_config:
-                    self.send_error(400, f"Missing required field: {field}")
-                    return
+            missing = _REQUIRED_CONFIG_FIELDS - new_config.keys()
+            if missing:
+                self.send_error(400, f"Missing required field: {', '.join(sorted(missing))}")
+                return
+            for field in _CONFIG_FIELD_ORDER:  # Fixed order so the reported field is stable
                 if not isinstance(new_config[field], int) or new_config[field] <= 0:
                     self.send_error(400, f"Invalid value for {field}: must be a positive integer")
                     return
@@ -1672,52 +2333,22 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                 self.send_error(400, "Epochs cannot exceed 20")
                 return
             
-            # Read current config.py
-            with open('config.py', 'r') as f:
-                config_content = f.read()
-            
-            # Update the configuration values
-            config_content = re.sub(
-                r'number_of_clients = \d+',
-                f'number_of_clients = {new_config["clients"]}',
-                config_content
-            )
-            config_content = re.sub(
-                r'num_servers = \d+',
-                f'num_servers = {new_config["servers"]}',
-                config_content
-            )
-            config_content = re.sub(
-                r'train_dataset_size = \d+',
-                f'train_dataset_size = {new_config["train_dataset_size"]}',
-                config_content
-            )
-            config_content = re.sub(
-                r'training_rounds = \d+',
-                f'training_rounds = {new_config["rounds"]}',
-                config_content
-            )
-            config_content = re.sub(
-                r'epochs = \d+',
-                f'epochs = {new_config["epochs"]}',
-                config_content
-            )
-            config_content = re.sub(
-                r'batch_size = \d+',
-                f'batch_size = {new_config["batch_size"]}',
-                config_content
-            )
-            
-            # Write the updated config back
-            with open('config.py', 'w') as f:
-                f.write(config_content)
+            _rewrite_config({
+                'number_of_clients': new_config['clients'],
+                'num_servers': new_config['servers'],
+                'train_dataset_size': new_config['train_dataset_size'],
+                'training_rounds': new_config['rounds'],
+                'epochs': new_config['epochs'],
+                'batch_size': new_config['batch_size'],
+            })
             
             print(f"Configuration updated: {new_config}")
             
             self.send_response(200)
             self.send_header('Content-type', 'text/plain')
+            self.send_header('Content-Length', str(len(_MSG_CFG_OK)))
             self.end_headers()
-            self.wfile.write("Configuration updated successfully!".encode())
+            self.wfile.write(_MSG_CFG_OK)
             
         except Exception as e:
             print(f"Error updating config: {str(e)}")
@@ -1728,15 +2359,13 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
         try:
             # Get the request body
             content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            new_config = json.loads(post_data.decode('utf-8'))
+            new_config = json.loads(self.rfile.read(content_length))
             
             # Validate the configuration
-            required_fields = ['dp_epsilon', 'dp_sensitivity', 'num_shares', 'threshold']
-            for field in required_fields:
-                if field not in new_config:
-                    self.send_error(400, f"Missing required field: {field}")
-                    return
+            missing = _REQUIRED_DPSSHARE_FIELDS - new_config.keys()
+            if missing:
+                self.send_error(400, f"Missing required field: {', '.join(sorted(missing))}")
+                return
             
             # Validate ranges
             if new_config['dp_epsilon'] <= 0 or new_config['dp_epsilon'] > 20:
@@ -1752,42 +2381,20 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
                 self.send_error(400, "Threshold must be between 2 and number of shares")
                 return
             
-            # Read current config.py
-            with open('config.py', 'r') as f:
-                config_content = f.read()
-            
-            # Update the DPSShare configuration values
-            config_content = re.sub(
-                r'dp_epsilon = [0-9]*\.?[0-9]+',
-                f'dp_epsilon = {new_config["dp_epsilon"]}',
-                config_content
-            )
-            config_content = re.sub(
-                r'dp_sensitivity = [0-9]*\.?[0-9]+',
-                f'dp_sensitivity = {new_config["dp_sensitivity"]}',
-                config_content
-            )
-            config_content = re.sub(
-                r'num_shares = \d+',
-                f'num_shares = {new_config["num_shares"]}',
-                config_content
-            )
-            config_content = re.sub(
-                r'threshold = \d+',
-                f'threshold = {new_config["threshold"]}',
-                config_content
-            )
-            
-            # Write the updated config back
-            with open('config.py', 'w') as f:
-                f.write(config_content)
+            _rewrite_config({
+                'dp_epsilon': new_config['dp_epsilon'],
+                'dp_sensitivity': new_config['dp_sensitivity'],
+                'num_shares': new_config['num_shares'],
+                'threshold': new_config['threshold'],
+            })
             
             print(f"DPSShare configuration updated: {new_config}")
             
             self.send_response(200)
             self.send_header('Content-type', 'text/plain')
+            self.send_header('Content-Length', str(len(_MSG_DPS_OK)))
             self.end_headers()
-            self.wfile.write("DPSShare configuration updated successfully!".encode())
+            self.wfile.write(_MSG_DPS_OK)
             
         except Exception as e:
             print(f"Error updating DPSShare config: {str(e)}")
@@ -1800,67 +2407,40 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
             
             print("Starting reinitialization: killing all federated learning processes...")
             
-            # Kill all federated learning processes by name
-            process_names = [
-                'fedshareclient.py', 'fedshareserver.py', 'fedshareleadserver.py',
-                'fedavgclient.py', 'fedavgserver.py',
-                'scotchclient.py', 'scotchserver.py',
-                'dpsshareclient.py', 'dpsshareserver.py',
-                'logger_server.py', 'flask_starter.py'
-            ]
-            
-            for process_name in process_names:
-                subprocess.run(['pkill', '-f', process_name], capture_output=True)
-            
-            # Also kill by algorithm names for broader cleanup
-            algorithms = ['fedshare', 'fedavg', 'scotch', 'dpsshare']
-            for algorithm in algorithms:
-                subprocess.run(['pkill', '-f', algorithm], capture_output=True)
-            
-            # Clean up tracked processes
-            for algorithm, process_data in running_processes.items():
-                try:
-                    if isinstance(process_data, dict):
-                        # FedShare stores a dict of processes
-                        for proc in process_data.values():
-                            if hasattr(proc, 'poll') and proc.poll() is None:
-                                proc.terminate()
-                    elif hasattr(process_data, 'poll') and process_data.poll() is None:
-                        # Other algorithms store a single process
-                        process_data.terminate()
-                except:
-                    pass
+            # Stop tracked processes through their process groups, escalating to SIGKILL
+            stop_process_groups(list(tracked_processes()))
+            for process_data in running_processes.values():
+                if isinstance(process_data, dict):
+                    for proc_info in process_data.values():
+                        proc_info['log_file'].close()
+            
+            # Sweep for anything untracked, e.g. left over from a previous server instance
+            subprocess.run(['pkill', '-f', _FL_PROCESS_PATTERN], capture_output=True)
             
             running_processes.clear()
+            process_status.clear()
             progress_data.clear()
+            _progress_cache.clear()
+            with _log_state_lock:
+                _log_states.clear()
             
             # Clean up all log directories - use current config to generate names
-            import importlib
-            import config
-            importlib.reload(config)
-            
-            total_clients = config.Config.number_of_clients
-            num_servers = config.Config.num_servers
+            cfg = _get_config()
+            total_clients = cfg['number_of_clients']
+            num_servers = cfg['num_servers']
             
-            log_dirs = [
-                f'logs/fedshare-mnist-client-{total_clients}-server-{num_servers}',
-                f'logs/fedavg-mnist-client-{total_clients}',
-                f'logs/scotch-mnist-client-{total_clients}-server-{num_servers}',
-                f'logs/dpsshare-mnist-client-{total_clients}-server-{num_servers}'
-            ]
+            log_dirs = [fmt.format(c=total_clients, s=num_servers) for fmt in _LOG_DIR_FMT.values()]
             
             for log_dir in log_dirs:
-                subprocess.run(['rm', '-rf', log_dir], capture_output=True)
-            
-            # Wait a moment for processes to clean up
-            time.sleep(2)
+                shutil.rmtree(log_dir, ignore_errors=True)
             
             print("Reinitialization completed successfully!")
             
             self.send_response(200)
             self.send_header('Content-type', 'text/plain')
+            self.send_header('Content-Length', str(len(_MSG_REINIT_OK)))
             self.end_headers()
-            self.wfile.write("All processes killed and system reinitialized successfully!".encode())
+            self.wfile.write(_MSG_REINIT_OK)
             
         except Exception as e:
             print(f"Error during reinitialization: {str(e)}")
@@ -1870,12 +2450,14 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
         """Get all saved results as JSON"""
         try:
             results = load_all_results()
+            body = json.dumps(results, indent=2).encode()
             
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
             self.send_header('Cache-Control', 'no-cache')
             self.end_headers()
-            self.wfile.write(json.dumps(results, indent=2).encode())
+            self.wfile.write(body)
             
         except Exception as e:
             print(f"Error getting results: {str(e)}")
@@ -1893,8 +2475,9 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
             
             self.send_response(200)
             self.send_header('Content-type', 'text/plain')
+            self.send_header('Content-Length', str(len(_MSG_CLEARED_OK)))
             self.end_headers()
-            self.wfile.write("All results cleared successfully!".encode())
+            self.wfile.write(_MSG_CLEARED_OK)
             
         except Exception as e:
             print(f"Error clearing results: {str(e)}")
@@ -2210,11 +2793,13 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
 </body>
 </html>"""
             
+            body = html.encode()
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
             self.send_header('Cache-Control', 'no-cache')
             self.end_headers()
-            self.wfile.write(html.encode())
+            self.wfile.write(body)
             
         except Exception as e:
             print(f"Error showing comparison: {str(e)}")
@@ -2222,21 +2807,37 @@ class EnhancedFedShareHandler(http.server.SimpleHTTPRequestHandler):
             traceback.print_exc()
             self.send_error(500, str(e))
 
-class ReusableTCPServer(socketserver.TCPServer):
+class PooledHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server that runs requests on a bounded worker pool"""
+    daemon_threads = True
     allow_reuse_address = True
+    # Event streams (progress and live logs) each hold a worker for minutes at a time
+    max_workers = 64
+    
+    def __init__(self, *args, **kwargs):
+        # Created first: a failed bind calls server_close() from TCPServer.__init__
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='http-worker')
+        super().__init__(*args, **kwargs)
+    
+    def process_request(self, request, client_address):
+        # Reuse pooled threads instead of spawning one per connection
+        self._executor.submit(self.process_request_thread, request, client_address)
+    
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False)
+
+# Handlers only do shallow, I/O-bound work; the 8 MiB default stack is wasted per thread
+THREAD_STACK_SIZE = 512 * 1024
 
 def start_server():
-    import socketserver
-    
     PORT = int(os.getenv('PORT', 5000))
-    
-    # Create a threaded HTTP server with proper error handling
-    class ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
-        daemon_threads = True
-        allow_reuse_address = True
+    # Applies to every thread started from here on: HTTP workers, background tasks, watchers
+    threading.stack_size(THREAD_STACK_SIZE)
     
     try:
-        httpd = ThreadingHTTPServer(("0.0.0.0", PORT), EnhancedFedShareHandler)
+        httpd = PooledHTTPServer(("0.0.0.0", PORT), EnhancedFedShareHandler)
         print(f"🚀 Enhanced FedShare server running on http://0.0.0.0:{PORT}", flush=True)
         print("Enhanced interface with real-time progress tracking!", flush=True)
         httpd.serve_forever()
@@ -1,4 +1,3 @@
-import pickle
 import sys
 import threading
 
@@ -36,7 +35,7 @@ def start_next_round(data):
 
     global training_round
     if data:  # Only load weights if we received data from server
-        round_weight = pickle.loads(data)
+        round_weight = flcommon.loads_arrays(data)
         model.set_weights(round_weight)
         print(f"Client {config.client_index} loaded weights from server (round {training_round + 1})")
 
@@ -65,11 +64,11 @@ def start_next_round(data):
     for weight_array in model_weights:
         layers.append(weight_array.astype('float64'))
 
-    pickle_model = pickle.dumps(layers)  # Send as list, not array
+    serialized_model = flcommon.dumps_arrays(layers)
 
-    flcommon.send_to_fedavg_server(pickle_model, config)
+    flcommon.send_to_fedavg_server(serialized_model, config)
 
-    len_serialized_model = len(pickle_model)
+    len_serialized_model = len(serialized_model)
     global total_upload_cost
     total_upload_cost += len_serialized_model
 
@@ -112,7 +111,7 @@ def recv_thread(data):
     global training_round
     if config.training_rounds == training_round:
         # Evaluate global performance on the final aggregated model
-        final_weights = pickle.loads(data)
+        final_weights = flcommon.loads_arrays(data)
         flcommon.evaluate_global_performance("FedAvg", final_weights, mnistcommon.get_model)
         
         time_logger.finish_training()
@@ -1,4 +1,3 @@
-import pickle
 import threading
 
 import numpy as np
@@ -14,6 +13,9 @@ config = FedAvgServerConfig()
 
 clients_secret = []
 aggregation_lock = threading.Lock()
+# float32 scratch arrays for aggregation, keyed by layer shape and reused every round
+scratch_buffers = {}
+scratch_lock = threading.Lock()
 
 total_download_cost = 0
 total_upload_cost = 0
@@ -27,29 +29,35 @@ def recv():
 
 
 def recv_thread(data, address, clients_secret: list):
+    global total_download_cost, total_upload_cost
     time_logger.server_received()
 
     len_joined_data = len(data)
     print(f"[DOWNLOAD] Secret of {address} received. size: {len_joined_data}")
 
-    global total_download_cost
-    total_download_cost += len_joined_data
-
-    secret = pickle.loads(data)
+    secret = flcommon.loads_arrays(data)
     
-    # Critical section: protect shared state with lock
+    # Short critical section: record the secret and, once all have arrived, take the batch
     with aggregation_lock:
+        total_download_cost += len_joined_data
         clients_secret.append(secret)
-        
-        print(f"[SECRET] Secret received successfully. Total received: {len(clients_secret)}/{config.number_of_clients}")
+        received = len(clients_secret)
+        if received == config.number_of_clients:
+            batch = clients_secret[:]
+            clients_secret.clear()
 
-        if len(clients_secret) != config.number_of_clients:
-            return
+    # Logged after releasing the lock so stdout writes never hold up other handlers
+    print(f"[SECRET] Secret received successfully. Total received: {received}/{config.number_of_clients}")
 
-        time_logger.server_start()
-        
+    if received != config.number_of_clients:
+        return
+
+    time_logger.server_start()
+
+    # Aggregation only needs the batch; its own lock guards the shared scratch buffers
+    with scratch_lock:
         # Calculate correct normalization weights
-        num_participating_clients = len(clients_secret)
+        num_participating_clients = len(batch)
         participating_dataset_sizes = config.clients_dataset_size[:num_participating_clients]
         total_participating_size = sum(participating_dataset_sizes)
         
@@ -64,29 +72,33 @@ def recv_thread(data, address, clients_secret: list):
         print(f"  Normalized weights: {normalized_weights}")
         print(f"  Weights sum: {sum(normalized_weights):.6f}")
         
-        # Perform weighted aggregation
-        model = {}
-        for layer_index in range(len(clients_secret[0])):
-            alpha_list = []
-            for client_index in range(num_participating_clients):
-                alpha = clients_secret[client_index][layer_index] * normalized_weights[client_index]
-                alpha_list.append(alpha)
-            model[layer_index] = np.array(alpha_list).sum(axis=0, dtype=np.float32)
-
-        # Convert dictionary back to list for Keras model.set_weights()
-        model_weights_list = [model[i] for i in range(len(model))]
+        # Perform weighted aggregation, accumulating each layer in place
+        # instead of stacking every client's scaled copy first
+        model_weights_list = []
+        for layer_index in range(len(batch[0])):
+            layer = np.empty(np.shape(batch[0][layer_index]), dtype=np.float32)
+            np.multiply(batch[0][layer_index], normalized_weights[0], out=layer)
+            scaled = scratch_buffers.get(layer.shape)
+            if scaled is None:
+                scaled = scratch_buffers[layer.shape] = np.empty_like(layer)
+            for client_index in range(1, num_participating_clients):
+                np.multiply(batch[client_index][layer_index], normalized_weights[client_index], out=scaled)
+                layer += scaled
+            model_weights_list.append(layer)
         
-        clients_secret.clear()
-        pickle_model = pickle.dumps(model_weights_list)
-        flcommon.broadcast_to_clients(pickle_model, config, False)
+    serialized_model = flcommon.dumps_arrays(model_weights_list)
+
+    with aggregation_lock:
+        total_upload_cost += len(serialized_model) * config.number_of_clients
+        download_cost, upload_cost = total_download_cost, total_upload_cost
 
-        global total_upload_cost
-        total_upload_cost += len(pickle_model) * config.number_of_clients
+    # Broadcast outside the lock so a slow client cannot stall other /recv handlers
+    flcommon.broadcast_to_clients(serialized_model, config, False)
 
-        print(f"[DOWNLOAD] Total download cost so far: {total_download_cost}")
-        print(f"[UPLOAD] Total upload cost so far: {total_upload_cost}")
+    print(f"[DOWNLOAD] Total download cost so far: {download_cost}")
+    print(f"[UPLOAD] Total upload cost so far: {upload_cost}")
 
-        print(f"********************** [ROUND] Round completed **********************")
+    print(f"********************** [ROUND] Round completed **********************")
         
     time_logger.server_idle()
 
@@ -109,7 +109,7 @@ def start_next_round(data):
 
     pickle_model_list = []
     for server in range(config.num_servers):
-        pickle_model_list.append(pickle.dumps(all_servers[server]))
+        pickle_model_list.append(pickle.dumps(all_servers[server], protocol=pickle.HIGHEST_PROTOCOL))
         len_serialized_model = len(pickle_model_list[server])
         total_upload_cost += len_serialized_model
         print(f"[Upload] Size of the object to send to server {server} is {len_serialized_model}")
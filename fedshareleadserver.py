@@ -65,7 +65,7 @@ def recv_thread(servers_secret, data, remote_addr):
 
         servers_secret.clear()
 
-        pickle_model = pickle.dumps(fedshare_weights)
+        pickle_model = pickle.dumps(fedshare_weights, protocol=pickle.HIGHEST_PROTOCOL)
         flcommon.broadcast_to_clients(pickle_model, config, lead_server=True)
 
         global total_upload_cost
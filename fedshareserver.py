@@ -52,7 +52,7 @@ def recv_thread(clients_secret, data, remote_addr):
                 alpha_list.append(alpha)
             model[layer_index] = np.array(alpha_list).sum(axis=0, dtype=np.float64)
 
-        pickle_model = pickle.dumps(model)
+        pickle_model = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
         len_dumped_model = len(pickle_model)
 
         time_logger.server_start_upload()
@@ -1,5 +1,7 @@
+import io
 import ipaddress
 import pickle
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import numpy as np
 import threading
@@ -45,14 +47,74 @@ def i_to_f(x, scale=1 << 32):
     return y
 
 
-f_to_i_v = np.vectorize(f_to_i)
-i_to_f_v = np.vectorize(i_to_f)
+def f_to_i_v(x, scale=1 << 32):
+    """Array version of f_to_i, element for element the same result without a Python call per value"""
+    x = np.asarray(x, dtype=np.float64)
+    scaled = np.abs(x) * scale
+    negative = x < 0
+    # Negative values wrap to 2**64 - |x| * scale, or 0 when that rounds up to 2**64
+    wrapped = float(1 << 64) - scaled
+    underflow = negative & (wrapped >= float(1 << 64))
+    # Non-negative values saturate at 2**63 - 1 once |x| * scale exceeds 2**64
+    overflow = ~negative & (scaled > float(1 << 64))
+    values = np.where(negative, wrapped, scaled)
+    values[underflow | overflow] = 0
+    out = values.astype(np.uint64)
+    out[overflow] = np.uint64(9223372036854775807)
+    return out
+
+
+# Scalar dtype i_to_f produces for this NumPy (float32 under NumPy 2, float64 before)
+_I_TO_F_DTYPE = (np.float32(1) / (1 << 32)).dtype
+
+
+def i_to_f_v(x, scale=1 << 32):
+    """Array version of i_to_f, element for element the same result without a Python call per value"""
+    x = np.asarray(x, dtype=np.uint64)
+    negative = x > np.uint64(9223372036854775807)
+    # Two's complement magnitude, rounded straight from uint64 to float32 like i_to_f
+    magnitude = np.where(negative, np.uint64(0) - x, x).astype(np.float32)
+    np.negative(magnitude, out=magnitude, where=negative)
+    return magnitude.astype(_I_TO_F_DTYPE, copy=False) / scale
+
+
+# ------------------------------------------------------------------------------
+# Weight serialization
+# ------------------------------------------------------------------------------
+def dumps_arrays(arrays):
+    """Serialize a list of arrays as back-to-back .npy records; unlike pickle, loading runs no code"""
+    buffer = io.BytesIO()
+    for array in arrays:
+        np.lib.format.write_array(buffer, np.asanyarray(array), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def loads_arrays(data):
+    """Inverse of dumps_arrays; rejects object arrays and anything that is not .npy framing"""
+    buffer = io.BytesIO(data)
+    arrays = []
+    while buffer.tell() < len(data):
+        arrays.append(np.lib.format.read_array(buffer, allow_pickle=False))
+    return arrays
+
+
+# Evaluation only swaps weights in, so one compiled model per generator is reused
+_eval_models = {}
+_eval_models_lock = threading.Lock()
+
+
+def get_eval_model(model_generator):
+    with _eval_models_lock:
+        model = _eval_models.get(model_generator)
+        if model is None:
+            model = _eval_models[model_generator] = model_generator()
+        return model
 
 
 def check_test_accuracy(name, training_round, training_rounds, x_test, y_test, verbose, weights, model_generator, each):
     print(f"+++++++ round: {training_round}/{training_rounds} +++++++")
     if training_round % each == 0:
-        model = model_generator()
+        model = get_eval_model(model_generator)
 
         model.set_weights(weights)
         results = model.evaluate(x_test, y_test, verbose=verbose)
@@ -62,7 +124,7 @@ def check_test_accuracy(name, training_round, training_rounds, x_test, y_test, v
 
 
 def check_test_accuracy_simple(x_test, y_test, verbose, weights, model_generator):
-    model = model_generator()
+    model = get_eval_model(model_generator)
     model.set_weights(weights)
     results = model.evaluate(x_test, y_test, verbose=verbose)
     print(f"Model test accuracy:\t {results[1]}")
@@ -79,7 +141,7 @@ def evaluate_global_performance(algorithm_name, weights, model_generator):
     x_test, y_test = mnistcommon.load_test_dataset()
     
     # Create and configure the model
-    model = model_generator()
+    model = get_eval_model(model_generator)
     model.set_weights(weights)
     
     # Evaluate the model on the complete test dataset
@@ -100,15 +162,41 @@ def evaluate_global_performance(algorithm_name, weights, model_generator):
     return global_loss, global_accuracy
 
 
+# ------------------------------------------------------------------------------
+# Model transfer
+# ------------------------------------------------------------------------------
+# Upload fan-out runs on one reused pool, and every destination is reached through a
+# keep-alive session per source address, so rounds reuse threads and TCP connections.
+SEND_POOL_SIZE = 32
+_send_pool = ThreadPoolExecutor(max_workers=SEND_POOL_SIZE, thread_name_prefix='fl-send')
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(source_address):
+    with _sessions_lock:
+        session = _sessions.get(source_address)
+        if session is None:
+            session = requests.Session()
+            # Payloads are pickled bytes: requests sends them as-is with a Content-Length
+            session.headers['Content-Type'] = 'application/octet-stream'
+            session.mount('http://', source.SourceAddressAdapter(source_address, pool_maxsize=SEND_POOL_SIZE))
+            _sessions[source_address] = session
+        return session
+
+
+def send_all(target, args_list):
+    futures = [_send_pool.submit(target, *args) for args in args_list]
+    print(f"[THREAD] Waiting for {len(futures)} transfers")
+    wait(futures)
+    for future in futures:
+        if future.exception() is not None:
+            print(f"[THREAD] Transfer failed: {future.exception()!r}")
+
+
 def broadcast_to_clients(pickle_model, config, lead_server=False):
-    my_threads = []
-    for client in range(config.number_of_clients):
-        my_thread = threading.Thread(target=send_to_client, args=(client, pickle_model, config, lead_server))
-        my_thread.start()
-        my_threads.append(my_thread)
-    for th in my_threads:
-        print(f"[THREAD] Waiting for thread {th.name}")
-        th.join()
+    send_all(send_to_client, [(client, pickle_model, config, lead_server)
+                              for client in range(config.number_of_clients)])
 
 
 def send_to_client(client, pickle_model, config, lead_server):
@@ -120,9 +208,7 @@ def send_to_client(client, pickle_model, config, lead_server):
     port = config.client_base_port + client
 
     url = f'http://{config.client_address}:{port}/recv'
-    s = requests.Session()
-    new_source = source.SourceAddressAdapter(config.master_server_address)
-    s.mount('http://', new_source)
+    s = get_session(config.master_server_address)
     print(s.post(url, pickle_model).json())
     print(f"[CLIENT] model sent to client {client}")
 
@@ -132,22 +218,14 @@ def get_ip(config):
 
 
 def send_to_servers(pickle_model_list, config):
-    my_threads = []
-    for index in range(config.num_servers):
-        my_thread = threading.Thread(target=send_to_server, args=(index, pickle_model_list[index], config))
-        my_thread.start()
-        my_threads.append(my_thread)
-    for th in my_threads:
-        print(f"[THREAD] Waiting for thread {th.name}")
-        th.join()
+    send_all(send_to_server, [(index, pickle_model_list[index], config)
+                              for index in range(config.num_servers)])
 
 
 def send_to_server(server, pickle_model, config):
     time_logger.client_start_upload()
     url = f'http://{config.server_address}:{config.server_base_port + server}/recv'
-    s = requests.Session()
-    new_source = source.SourceAddressAdapter(get_ip(config))
-    s.mount('http://', new_source)
+    s = get_session(get_ip(config))
     print(s.post(url, pickle_model).json())
 
     print(f"Sent to server {server}")
@@ -156,9 +234,7 @@ def send_to_server(server, pickle_model, config):
 def send_to_fedavg_server(pickle_model, config):
     time_logger.client_start_upload()
     url = f'http://{config.server_address}:{config.fedavg_server_port}/recv'
-    s = requests.Session()
-    new_source = source.SourceAddressAdapter(get_ip(config))
-    s.mount('http://', new_source)
+    s = get_session(get_ip(config))
     print(s.post(url, pickle_model).json())
 
     print(f"Sent to fedavg server.")
\ No newline at end of file
@@ -20,8 +20,8 @@ config = ClientConfig(int(sys.argv[1]))
 client_datasets = mnistcommon.load_train_dataset(config.number_of_clients, permute=True)
 LD = len(client_datasets[0][0]) // config.training_rounds
 
-f_to_i_v = np.vectorize(flcommon.f_to_i)
-i_to_f_v = np.vectorize(flcommon.i_to_f)
+f_to_i_v = flcommon.f_to_i_v
+i_to_f_v = flcommon.i_to_f_v
 
 api = Flask(__name__)
 
@@ -95,7 +95,7 @@ def start_next_round(round_weight):
     global total_upload_cost
     pickle_model_list = []
     for server in range(config.num_servers):
-        pickle_model_list.append(pickle.dumps(all_servers[server]))
+        pickle_model_list.append(pickle.dumps(all_servers[server], protocol=pickle.HIGHEST_PROTOCOL))
         len_serialized_model = len(pickle_model_list[server])
         total_upload_cost += len_serialized_model
         print(f"[Upload] Size of the object to send to server {server} is {len_serialized_model}")
@@ -10,8 +10,8 @@ from config import ServerConfig
 
 config = ServerConfig(int(sys.argv[1]))
 
-f_to_i_v = np.vectorize(flcommon.f_to_i)
-i_to_f_v = np.vectorize(flcommon.i_to_f)
+f_to_i_v = flcommon.f_to_i_v
+i_to_f_v = flcommon.i_to_f_v
 
 from flask import Flask, request
 
@@ -65,7 +65,7 @@ def recv_thread(clients_secret: list, data, address):
             for client_index in range(config.number_of_clients):
                 secrets_summation += current_batch[client_index][layer_index]
             model[layer_index] = secrets_summation
-        pickled_model = pickle.dumps(model)
+        pickled_model = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
         flcommon.broadcast_to_clients(pickled_model, config, lead_server=False)
 
         global total_upload_cost
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import gzip
 import http.server
 import socketserver
 import subprocess
@@ -13,24 +14,8 @@ PORT = 5000
 # Track running processes
 running_processes = {}
 
-class FedShareHandler(http.server.SimpleHTTPRequestHandler):
-    def do_GET(self):
-        if self.path == '/':
-            self.serve_homepage()
-        elif self.path.startswith('/run/'):
-            algorithm = self.path.split('/')[-1]
-            self.run_algorithm(algorithm)
-        elif self.path.startswith('/logs/'):
-            algorithm = self.path.split('/')[-1]
-            self.show_logs(algorithm)
-        elif self.path.startswith('/status/'):
-            algorithm = self.path.split('/')[-1]
-            self.get_status(algorithm)
-        else:
-            super().do_GET()
-    
-    def serve_homepage(self):
-        html = """<!DOCTYPE html>
+# The homepage is static: encode and compress it once instead of on every request
+HOMEPAGE_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -202,12 +187,40 @@ class FedShareHandler(http.server.SimpleHTTPRequestHandler):
         </div>
     </div>
 </body>
+</html>""".encode('utf-8')
+HOMEPAGE_GZIP = gzip.compress(HOMEPAGE_HTML, compresslevel=6)
+LOG_PAGE_FOOTER = b"""
+    </div>
+</body>
 </html>"""
-        
+
+class FedShareHandler(http.server.SimpleHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/':
+            self.serve_homepage()
+        elif self.path.startswith('/run/'):
+            algorithm = self.path.split('/')[-1]
+            self.run_algorithm(algorithm)
+        elif self.path.startswith('/logs/'):
+            algorithm = self.path.split('/')[-1]
+            self.show_logs(algorithm)
+        elif self.path.startswith('/status/'):
+            algorithm = self.path.split('/')[-1]
+            self.get_status(algorithm)
+        else:
+            super().do_GET()
+    
+    def serve_homepage(self):
+        body = HOMEPAGE_HTML
         self.send_response(200)
         self.send_header('Content-type', 'text/html')
+        self.send_header('Vary', 'Accept-Encoding')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = HOMEPAGE_GZIP
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(body)
     
     def run_algorithm(self, algorithm):
         script_map = {
@@ -266,7 +279,7 @@ class FedShareHandler(http.server.SimpleHTTPRequestHandler):
         
         log_dir = f"logs/{log_directories[algorithm]}"
         
-        html = f"""<!DOCTYPE html>
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <title>{algorithm.upper()} Logs</title>
@@ -285,7 +298,7 @@ class FedShareHandler(http.server.SimpleHTTPRequestHandler):
 <body>
     <div class="container">
         <a href="/" class="back-btn">← Back to Main</a>
-        <h1>📋 {algorithm.upper()} Training Logs</h1>"""
+        <h1>📋 {algorithm.upper()} Training Logs</h1>"""]
         
         if os.path.exists(log_dir):
             for filename in os.listdir(log_dir):
@@ -294,28 +307,26 @@ class FedShareHandler(http.server.SimpleHTTPRequestHandler):
                     try:
                         with open(filepath, 'r') as f:
                             content = f.read()
-                        html += f"""
+                        parts.append(f"""
         <div class="log-file">
             <div class="log-header">📄 {filename}</div>
             <div class="log-content">{content}</div>
-        </div>"""
+        </div>""")
                     except Exception as e:
-                        html += f"<p>Error reading {filename}: {str(e)}</p>"
+                        parts.append(f"<p>Error reading {filename}: {str(e)}</p>")
         else:
-            html += f"""<div style="text-align: center; color: #666; padding: 40px; font-style: italic;">
+            parts.append(f"""<div style="text-align: center; color: #666; padding: 40px; font-style: italic;">
                 No logs found for {algorithm.upper()}.<br>
                 Run the algorithm first to generate training logs.
-            </div>"""
-        
-        html += """
-    </div>
-</body>
-</html>"""
+            </div>""")
         
+        # One encode of the joined page, closed by the pre-encoded static footer
+        body = ''.join(parts).encode() + LOG_PAGE_FOOTER
         self.send_response(200)
         self.send_header('Content-type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(body)
     
     def get_status(self, algorithm):
         if algorithm in running_processes:
@@ -28,7 +28,7 @@ sleep 3
 echo "Initializing TA system (CP-ABE setup)..."
 $PYTHON -c "
 import requests
-import pickle
+import flcommon
 import mnistcommon
 import json
 
@@ -47,10 +47,10 @@ if response.status_code == 200:
     initial_weights = model.get_weights()
     
     # Encrypt model with CP-ABE
-    response = requests.post('http://127.0.0.1:9600/encrypt_model', json={
-        'model_hex': pickle.dumps(initial_weights).hex(),
-        'policy': {'role': 'hospital', 'region': 'North'}
-    })
+    response = requests.post('http://127.0.0.1:9600/encrypt_model',
+        data=flcommon.dumps_arrays(initial_weights),
+        params={'role': 'hospital', 'region': 'North'},
+        headers={'Content-Type': 'application/octet-stream'})
     
     if response.status_code == 200:
         print('[TA INIT] ✓ Initial model encrypted with CP-ABE')
@@ -16,11 +16,20 @@ import hashlib
 import json
 import pickle
 import time
+from functools import lru_cache
 from typing import Dict, List, Tuple, Any
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 import sys
+import threading
 
-from dpsshare_security import ProofOfWork
+import flcommon
+from dpsshare_security import PolicyCipher, ProofOfWork
+
+
+@lru_cache(maxsize=1024)
+def _secret_key(msk: bytes, facility_id: str, attributes_canon: bytes) -> str:
+    """Facility secret key; pure in its inputs so re-registrations hit the cache"""
+    return hashlib.sha256(b"|".join((msk, facility_id.encode(), attributes_canon))).hexdigest()
 
 
 class MockCPABE:
@@ -57,27 +66,19 @@ class MockCPABE:
         return public_key, master_secret_key
     
     @staticmethod
-    def key_generation(msk: str, facility_id: str, attributes: Dict[str, str]) -> str:
+    def key_generation(msk: bytes, facility_id: str, attributes: Dict[str, str]) -> str:
         """
         Generate attribute-based decryption key for facility
         
         Args:
-            msk: Master secret key
+            msk: Master secret key, already encoded to bytes
             facility_id: Unique facility identifier
             attributes: Facility attributes (e.g., {'role': 'hospital', 'region': 'North'})
             
         Returns:
             Secret key for the facility
         """
-        key_data = {
-            'msk': msk,
-            'facility_id': facility_id,
-            'attributes': attributes,
-            'timestamp': time.time()
-        }
-        
-        secret_key = hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
-        return secret_key
+        return _secret_key(msk, facility_id, PolicyCipher.canon(attributes))
     
     @staticmethod
     def encrypt(model_data: bytes, pk: str, policy: Dict[str, Any]) -> Dict[str, Any]:
@@ -92,14 +93,10 @@ class MockCPABE:
         Returns:
             Ciphertext dictionary
         """
-        encryption_key = hashlib.sha256(f"{pk}_{json.dumps(policy, sort_keys=True)}".encode()).digest()
-        
-        encrypted_data = bytearray()
-        for i, byte in enumerate(model_data):
-            encrypted_data.append(byte ^ encryption_key[i % len(encryption_key)])
+        encryption_key = PolicyCipher.derive_key(pk, policy)
         
         ciphertext = {
-            'ct': bytes(encrypted_data),
+            'ct': PolicyCipher.xor_with_key(model_data, encryption_key),
             'policy': policy,
             'pk': pk,
             'timestamp': time.time()
@@ -107,6 +104,14 @@ class MockCPABE:
         
         return ciphertext
     
+    @staticmethod
+    def policy_satisfied(policy: Dict[str, Any], facility_attributes: Dict[str, str]) -> bool:
+        """Check whether the facility attributes satisfy every clause of the access policy"""
+        return all(
+            facility_attributes.get(attr) == value
+            for attr, value in policy.items()
+        )
+    
     @staticmethod
     def decrypt(ciphertext: Dict[str, Any], sk: str, facility_attributes: Dict[str, str]) -> bytes:
         """
@@ -122,22 +127,13 @@ class MockCPABE:
         """
         policy = ciphertext['policy']
         
-        policy_satisfied = all(
-            facility_attributes.get(attr) == value
-            for attr, value in policy.items()
-        )
-        
-        if not policy_satisfied:
+        if not MockCPABE.policy_satisfied(policy, facility_attributes):
             return None
         
         pk = ciphertext['pk']
-        encryption_key = hashlib.sha256(f"{pk}_{json.dumps(policy, sort_keys=True)}".encode()).digest()
-        
-        decrypted_data = bytearray()
-        for i, byte in enumerate(ciphertext['ct']):
-            decrypted_data.append(byte ^ encryption_key[i % len(encryption_key)])
+        encryption_key = PolicyCipher.derive_key(pk, policy)
         
-        return bytes(decrypted_data)
+        return PolicyCipher.xor_with_key(ciphertext['ct'], encryption_key)
 
 
 class TrustedAuthority:
@@ -157,9 +153,14 @@ class TrustedAuthority:
         self.attributes = ['role', 'region', 'institution_type']
         self.public_key = None
         self.master_secret_key = None
+        self._msk_bytes = None
         self.registered_facilities = {}
         self.facility_keys = {}
         self.encrypted_model = None
+        # Pickled ciphertext, serialized once per model and served to every fetch
+        self.encrypted_model_bytes = None
+        # (ciphertext, decrypted weights) for the current model, reset on every encrypt
+        self._plaintext = None
         
         print(f"\n{'='*70}")
         print(f"[TRUSTED AUTHORITY] Initializing DPSShare System")
@@ -185,6 +186,7 @@ class TrustedAuthority:
             self.facilities,
             self.attributes
         )
+        self._msk_bytes = self.master_secret_key.encode()
         
         print(f"[SETUP] ✓ Public Key (PK) generated: {self.public_key[:32]}...")
         print(f"[SETUP] ✓ Master Secret Key (MSK) secured (confidential)")
@@ -220,7 +222,7 @@ class TrustedAuthority:
         print(f"[REGISTRATION] Generating attribute-based secret key...")
         
         secret_key = MockCPABE.key_generation(
-            self.master_secret_key,
+            self._msk_bytes,
             facility_id,
             attributes
         )
@@ -258,13 +260,17 @@ class TrustedAuthority:
         print(f"[DISTRIBUTION] Access Policy: {access_policy}")
         print(f"[DISTRIBUTION] Encrypting global model using CP-ABE...")
         
-        model_data = pickle.dumps(model_weights)
+        model_data = flcommon.dumps_arrays(model_weights)
+        self._plaintext = None
         
-        self.encrypted_model = MockCPABE.encrypt(
+        encrypted_model = MockCPABE.encrypt(
             model_data,
             self.public_key,
             access_policy
         )
+        # Publish the served bytes first so an unlocked fetch never sees a model without them
+        self.encrypted_model_bytes = pickle.dumps(encrypted_model, protocol=pickle.HIGHEST_PROTOCOL)
+        self.encrypted_model = encrypted_model
         
         print(f"[DISTRIBUTION] ✓ Model encrypted with CP-ABE")
         print(f"[DISTRIBUTION] ✓ Policy enforced: {access_policy}")
@@ -292,18 +298,25 @@ class TrustedAuthority:
             return None
         
         facility_info = self.facility_keys[facility_id]
+        # Read once so a concurrent /encrypt_model cannot swap the model mid-decrypt
+        encrypted_model = self.encrypted_model
         
-        decrypted_data = MockCPABE.decrypt(
-            self.encrypted_model,
-            facility_info['sk'],
-            facility_info['attributes']
-        )
-        
-        if decrypted_data is None:
+        if not MockCPABE.policy_satisfied(encrypted_model['policy'], facility_info['attributes']):
             print(f"[DECRYPTION] ✗ Access denied - Policy not satisfied")
             return None
         
-        model_weights = pickle.loads(decrypted_data)
+        # Every facility gets the same plaintext for a ciphertext, so decrypt it only once
+        cached = self._plaintext
+        if cached is not None and cached[0] is encrypted_model:
+            model_weights = cached[1]
+        else:
+            decrypted_data = MockCPABE.decrypt(
+                encrypted_model,
+                facility_info['sk'],
+                facility_info['attributes']
+            )
+            model_weights = flcommon.loads_arrays(decrypted_data)
+            self._plaintext = (encrypted_model, model_weights)
         print(f"[DECRYPTION] ✓ Model decrypted for {facility_id}")
         
         return model_weights
@@ -311,6 +324,8 @@ class TrustedAuthority:
 
 api = Flask(__name__)
 ta_instance = None
+# Serializes the routes that mutate TA state; the threaded server runs handlers concurrently
+ta_lock = threading.Lock()
 
 
 @api.route('/setup', methods=['POST'])
@@ -323,8 +338,9 @@ def setup():
     pow_difficulty = data.get('pow_difficulty', 4)
     security_param = data.get('security_param', 256)
     
-    ta_instance = TrustedAuthority(security_param, pow_difficulty)
-    pk = ta_instance.system_setup(num_facilities)
+    with ta_lock:
+        ta_instance = TrustedAuthority(security_param, pow_difficulty)
+        pk = ta_instance.system_setup(num_facilities)
     
     return jsonify({
         'success': True,
@@ -346,7 +362,8 @@ def register():
     nonce = data.get('nonce')
     attributes = data.get('attributes', {'role': 'hospital', 'region': 'North'})
     
-    result = ta_instance.register_facility(facility_id, nonce, attributes)
+    with ta_lock:
+        result = ta_instance.register_facility(facility_id, nonce, attributes)
     
     return jsonify(result)
 
@@ -359,16 +376,15 @@ def encrypt_model():
     if ta_instance is None:
         return jsonify({'success': False, 'error': 'TA not initialized'}), 400
     
-    data = request.json
-    model_weights = pickle.loads(bytes.fromhex(data.get('model_hex')))
-    access_policy = data.get('policy', {'role': 'hospital', 'region': 'North'})
+    # Body is the raw .npy-framed weights; the policy travels in the query string
+    model_weights = flcommon.loads_arrays(request.get_data())
+    access_policy = request.args.to_dict() or {'role': 'hospital', 'region': 'North'}
     
-    encrypted_model = ta_instance.encrypt_and_distribute_model(model_weights, access_policy)
+    with ta_lock:
+        ta_instance.encrypt_and_distribute_model(model_weights, access_policy)
+        encrypted_model_bytes = ta_instance.encrypted_model_bytes
     
-    return jsonify({
-        'success': True,
-        'ciphertext': pickle.dumps(encrypted_model).hex()
-    })
+    return Response(encrypted_model_bytes, mimetype='application/octet-stream')
 
 
 @api.route('/get_encrypted_model', methods=['GET'])
@@ -376,13 +392,11 @@ def get_encrypted_model():
     """Get encrypted model for distribution"""
     global ta_instance
     
-    if ta_instance is None or ta_instance.encrypted_model is None:
+    encrypted_model_bytes = ta_instance.encrypted_model_bytes if ta_instance is not None else None
+    if encrypted_model_bytes is None:
         return jsonify({'success': False, 'error': 'No encrypted model available'}), 400
     
-    return jsonify({
-        'success': True,
-        'ciphertext': pickle.dumps(ta_instance.encrypted_model).hex()
-    })
+    return Response(encrypted_model_bytes, mimetype='application/octet-stream')
 
 
 @api.route('/decrypt', methods=['POST'])
@@ -401,10 +415,7 @@ def decrypt():
     if model_weights is None:
         return jsonify({'success': False, 'error': 'Decryption failed'}), 403
     
-    return jsonify({
-        'success': True,
-        'model': pickle.dumps(model_weights).hex()
-    })
+    return Response(flcommon.dumps_arrays(model_weights), mimetype='application/octet-stream')
 
 
 @api.route('/health', methods=['GET'])